@@ -1,10 +1,12 @@
 import streamlit as st
 import os
-from PIL import Image
+from functools import lru_cache
 
 import common.session.authentication as auth
 import src.gui.sidebar as sidebar
+from src.session.translations import get_translator
 from src.gui.style import apply_style_navigation,apply_style_logo, apply_style_html_input
+from src.utils.mongodb_adapter import ensure_indexes
 
 
 # Function that handles login event
@@ -29,9 +31,58 @@ def logout():
         st.title(st.session_state.translator(":material/logout: Log out is disabled when logged in as _Guest_"))
 
 
+# Reads assistant icon only once per process, raw bytes are shared by all sessions
+@lru_cache(maxsize=1)
+def assistant_icon_bytes() -> bytes:
+    with open(".streamlit/icon.png", "rb") as icon_file:
+        return icon_file.read()
+
+
+# Page titles translated only once per language, shared by all sessions
+@lru_cache(maxsize=8)
+def page_titles(language: str) -> dict:
+    translator = get_translator(language)
+    return {
+        title: translator(title)
+        for title in ("Control panel", "Conversations review", "Knowledge base", "Conversation history", "Statistics", "FEI News", "Log out")
+    }
+
+
+# Builds navigation pages, pages are created on every run (st.Page objects keep per-run state)
+def build_pages(language: str) -> dict:
+
+    titles = page_titles(language)
+
+    control_panel = st.Page("admin_pages/control_panel.py",title=titles["Control panel"],icon="🖥️",url_path="control-panel",default=True)
+
+    conversations_review = st.Page("admin_pages/conversations_review.py",title=titles["Conversations review"],icon="✅",url_path="conversations-review")
+
+    webscraper = st.Page("admin_pages/webscraper.py",title="Webscraper",icon="🌐",url_path="webscraper")
+
+    faq = st.Page("admin_pages/faq.py",title="FAQ",icon="❓",url_path="faq")
+
+    knowledge_administration = st.Page("admin_pages/knowledge_administration.py",title=titles["Knowledge base"],icon="📚",url_path="knowledge-administration")
+
+    history_administration = st.Page("admin_pages/history_administration.py",title=titles["Conversation history"],icon="💭",url_path="history-administration")
+
+    statistics = st.Page("admin_pages/statistics.py",title=titles["Statistics"],icon="📊",url_path="statistics")
+
+    fei_news = st.Page("admin_pages/fei_news.py",title=titles["FEI News"],icon="📰",url_path="fei-news")
+
+    logout_page = st.Page(logout, title=titles["Log out"], icon=":material/logout:")
+
+    return {
+        "app_management": [control_panel,conversations_review,webscraper,faq,knowledge_administration,history_administration,statistics,fei_news],
+        "account_management": [logout_page],
+    }
+
+
 # Function that configured the application and serves as router for multipage app
 def start_app():
 
+    # Local alias of session state (used many times per rerun)
+    ss = st.session_state
+
     st.logo('.streamlit/sidebar_logo.png', icon_image='.streamlit/page_icon.png')
     apply_style_logo()
     apply_style_html_input()
@@ -40,40 +91,27 @@ def start_app():
     # ON LOCALHOST: please add GUEST_MODE variable to your local .env
     # GUEST_MODE=1 -> guest mode enable
     # GUEST_MODE=0 -> authentication enabled
-    if "guest_mode" not in st.session_state:
-        st.session_state.guest_mode = os.getenv("GUEST_MODE")
+    if "guest_mode" not in ss:
+        ss.guest_mode = os.getenv("GUEST_MODE")
 
-    if "authenticated" not in st.session_state:
-        st.session_state.authenticated = False
+    if "authenticated" not in ss:
+        ss.authenticated = False
+
+    # Create MongoDB indexes used by the app (only once per process)
+    ensure_indexes()
 
     # Set assistant icon for streamlit frontend
-    if "assistant_icon" not in st.session_state:
-        st.session_state.assistant_icon = Image.open(".streamlit/icon.png")
+    if "assistant_icon" not in ss:
+        ss.assistant_icon = assistant_icon_bytes()
 
     page_dict = {}
-    if st.session_state.authenticated:
+    if ss.authenticated:
         
-        control_panel = st.Page("admin_pages/control_panel.py",title=st.session_state.translator("Control panel"),icon="🖥️",url_path="control-panel",default=True)
-
-        conversations_review = st.Page("admin_pages/conversations_review.py",title=st.session_state.translator("Conversations review"),icon="✅",url_path="conversations-review")
-
-        webscraper = st.Page("admin_pages/webscraper.py",title="Webscraper",icon="🌐",url_path="webscraper")
-
-        faq = st.Page("admin_pages/faq.py",title="FAQ",icon="❓",url_path="faq")
-
-        knowledge_administration = st.Page("admin_pages/knowledge_administration.py",title=st.session_state.translator("Knowledge base"),icon="📚",url_path="knowledge-administration")
-            
-        history_administration = st.Page("admin_pages/history_administration.py",title=st.session_state.translator("Conversation history"),icon="💭",url_path="history-administration")
-
-        statistics = st.Page("admin_pages/statistics.py",title=st.session_state.translator("Statistics"),icon="📊",url_path="statistics")
-
-        fei_news = st.Page("admin_pages/fei_news.py",title=st.session_state.translator("FEI News"),icon="📰",url_path="fei-news")
-
-        app_management_pages = [control_panel,conversations_review,webscraper,faq,knowledge_administration,history_administration,statistics,fei_news]
+        pages = build_pages(ss.session_lang)
 
-        logout_page = st.Page(logout, title=st.session_state.translator("Log out"), icon=":material/logout:")
+        app_management_pages = pages["app_management"]
 
-        account_management_pages = [logout_page]
+        account_management_pages = pages["account_management"]
 
         page_dict[st.session_state.translator("Chat App Management")] = app_management_pages
 
@@ -81,7 +119,7 @@ def start_app():
 
 
     if len(page_dict) > 0:
-        pg = st.navigation({f"{st.session_state.user_name}": account_management_pages} | page_dict)
+        pg = st.navigation({f"{ss.user_name}": account_management_pages} | page_dict)
     else:
         pg = st.navigation([st.Page(login)])
 
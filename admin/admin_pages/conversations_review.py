@@ -17,8 +17,9 @@ def conversation_review() -> None:
 
     """
 
-    #Initialize 'conversation_index' variable, which is a session variable
-    if 'review_conversations_buffer' not in st.session_state:
+    #Initialize 'review_conversations_buffer' variable, which is a session variable
+    #Empty buffer is loaded again, so new conversations are found when all loaded ones are reviewed
+    if not st.session_state.get('review_conversations_buffer'):
         st.session_state.review_conversations_buffer = create_conversations_buffer()
 
     #Initialize 'conversation_index' variable, which is a session variable
@@ -1,72 +1,205 @@
 import streamlit as st
 
+from bson import ObjectId
 from common.session.db_connection import mongo_db
 from common.logging.st_logger import st_logger
-from PIL import Image
-import io
+
+# Number of news records rendered on one page
+PAGE_SIZE = 20
 
 
 def display_fei_news():
     """
     Entry point for the FEI news page. Every record is in expander form with
-    title, content and image. Each record has a delete button, which deletes the
-    record from the MongoDB collection.
+    title, thumbnail, content and image. Each record has a checkbox for selection, selected
+    records are deleted from the MongoDB collection at once by 'Delete selected' button. Records are paginated by '_id' (newest first),
+    only 'PAGE_SIZE' records are loaded from MongoDB per page. Content and full image
+    are loaded only when the user opens the record.
 
     Args:
         None
     Returns:
         None
     """
-    st.title(st.session_state.translator("📰 FEI News"))
+    # Local aliases of session state and translator (used many times per rerun)
+    ss = st.session_state
+    st.title(ss.translator("📰 FEI News"))
     mongo_db.set_collection("student_news")
-    records = mongo_db.collection.find()
-        
+
+    if "fei_news_last_id" not in ss:
+        ss.fei_news_last_id = None
+
+    if "pending_news_deletions" not in ss:
+        ss.pending_news_deletions = set()
+
+    st.button(
+        ss.translator("Delete selected"),
+        key="delete_selected_news",
+        disabled=not ss.pending_news_deletions,
+        on_click=on_click_delete_selected_news
+    )
+
+    # Keyset pagination - continue after the last '_id' of the previous page
+    last_id = ss.fei_news_last_id
+    query = {"_id": {"$lt": last_id}} if last_id else {}
+    records = mongo_db.collection.find(
+        query,
+        projection={"title": 1, "thumbnail": 1, "message_id": 1}
+    ).sort("_id", -1).limit(PAGE_SIZE).batch_size(PAGE_SIZE)
+
+    page_last_id = None
+    records_num = 0
     for record in records:
+        page_last_id = record["_id"]
+        records_num += 1
+        # Widget keys are based on unique '_id', so they are stable across reruns
+        record_key = str(record["_id"])
         try:
             with st.expander(record["title"], expanded=False):
-                st.write(record["content"])
-                try:
-                    image_bytes = record["image"]
-                    image = Image.open(io.BytesIO(image_bytes))
-                    st.image(image, use_container_width=True)
-                except Exception as e:
-                    st_logger.error("Error during loading of image: " + str(e))
-                st.button(
-                    st.session_state.translator("Delete"),
-                    key=str('delete_news_' + str(record["message_id"])),
-                    on_click=on_click_delete_news_record,
-                    args=[record["_id"]]
+                if record.get("thumbnail"):
+                    st.image(record["thumbnail"])
+                # Content and full image are loaded from MongoDB only for opened records
+                if st.toggle(ss.translator("Show whole news"), key=f"open_{record_key}"):
+                    details = load_news_details(record_key)
+                    # Record may have been deleted (e.g. in another session) after the list was loaded
+                    if details is None:
+                        st.warning(ss.translator("This news record no longer exists"))
+                    else:
+                        st.write(details["content"])
+                        # Streamlit decodes raw image bytes on its own
+                        if details.get("image"):
+                            st.image(details["image"], use_container_width=True)
+                st.checkbox(
+                    ss.translator("Select"),
+                    key=f"select_news_{record_key}",
+                    on_change=on_change_select_news_record,
+                    args=[record["_id"], f"select_news_{record_key}"]
                 )
         except Exception as e:
             st_logger.error("Error during loading of record: " + str(e))
             st.error("Error during loading of record.")
             with st.expander("CORRUPTED RECORD⚠️", expanded=False):
-                st.write(record)
-                st.button(
-                    st.session_state.translator("Delete"),
-                    key=str('delete_news_' + str(record["message_id"])),
-                    on_click=on_click_delete_news_record,
-                    args=[record["_id"]]
+                # Binary fields are not serialized for display
+                st.write({key: value for key, value in record.items() if key not in ("image", "thumbnail")})
+                st.checkbox(
+                    ss.translator("Select"),
+                    key=f"select_news_corrupt_{record_key}",
+                    on_change=on_change_select_news_record,
+                    args=[record["_id"], f"select_news_corrupt_{record_key}"]
                 )
 
+    build_pagination_buttons(page_last_id, records_num)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_news_details(record_id: str) -> dict:
+    """
+    Loads content and full image of one news record from the MongoDB collection.
+    Image is loaded from GridFS based on 'image_ref' (records not yet migrated keep inline 'image').
+
+    Args:
+        record_id (str): The ID of the news record
+    Returns:
+        dict: Dictionary with 'content' and 'image' of the record, None if the record does not exist
+    """
+    mongo_db.set_collection("student_news")
+    details = mongo_db.collection.find_one({"_id": ObjectId(record_id)}, {"content": 1, "image": 1, "image_ref": 1})
+    if details is None:
+        return None
+    if details.get("image_ref"):
+        details["image"] = mongo_db.get_file(details["image_ref"])
+    return details
+
+
+def build_pagination_buttons(page_last_id: object, records_num: int) -> None:
+    """
+    Displays 'First page' and 'Next page' buttons under the news list.
+
+    Args:
+        page_last_id (ObjectId): '_id' of the last record displayed on the current page
+        records_num (int): Number of records displayed on the current page
+    Returns:
+        None
+    """
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.button(
+            st.session_state.translator("First page"),
+            key="fei_news_first_page",
+            disabled=st.session_state.fei_news_last_id is None,
+            on_click=on_click_news_page,
+            args=[None]
+        )
+    with col2:
+        st.button(
+            st.session_state.translator("Next page"),
+            key="fei_news_next_page",
+            disabled=records_num < PAGE_SIZE,
+            on_click=on_click_news_page,
+            args=[page_last_id]
+        )
+
 
-def on_click_delete_news_record(record_id):
+def on_click_news_page(last_id: object) -> None:
     """
-    Delete a record from the MongoDB collection.
+    Button callback that moves the news list to the page after 'last_id'.
+    Selection is cleared, because checkboxes of the left page are not rendered anymore
+    and Streamlit drops their state.
 
     Args:
-        record_id (str): The ID of the record to be deleted.
+        last_id (ObjectId): '_id' of the last record of the previous page, None for the first page
     Returns:
         None
-    """        
+    """
+    st.session_state.fei_news_last_id = last_id
+    st.session_state.pending_news_deletions = set()
+
+
+def on_change_select_news_record(record_id: object, widget_key: str) -> None:
+    """
+    Checkbox callback that adds record to (or removes it from) records selected for deletion.
+
+    Args:
+        record_id (ObjectId): The ID of the record
+        widget_key (str): Key of the checkbox widget
+    Returns:
+        None
+    """
+    if st.session_state[widget_key]:
+        st.session_state.pending_news_deletions.add(record_id)
+    else:
+        st.session_state.pending_news_deletions.discard(record_id)
+
+
+def on_click_delete_selected_news() -> None:
+    """
+    Delete all selected records from the MongoDB collection by one request.
+
+    Args:
+        None
+    Returns:
+        None
+    """
+    record_ids = list(st.session_state.pending_news_deletions)
     try:
-        mongo_db.collection.delete_one({"_id": record_id})
+        mongo_db.set_collection("student_news")
+        # Images of the records are stored in GridFS
+        image_refs = [
+            record["image_ref"]
+            for record in mongo_db.collection.find({"_id": {"$in": record_ids}}, {"image_ref": 1})
+            if record.get("image_ref")
+        ]
+        result = mongo_db.collection.delete_many({"_id": {"$in": record_ids}})
+        for image_ref in image_refs:
+            mongo_db.delete_file(image_ref)
+        st.session_state.pending_news_deletions = set()
         st.toast(st.session_state.translator("Delete process finished ✔"))
-        st_logger.info(f"Deleted successfully news record: '{record_id}'")
+        st_logger.info(f"Deleted successfully {result.deleted_count} news records")
     except Exception as e:
-        st_logger.error("Error during deleting of news record: " + record_id)  
+        st_logger.error(f"Error during deleting of news records: {record_ids}: {e}")
         st.toast(st.session_state.translator("⚠️Error during deleting of News record"))
 
+
 # Main entry point for the FEI news page
 try:
     display_fei_news()
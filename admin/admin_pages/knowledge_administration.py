@@ -24,11 +24,18 @@ def details_page():
 
 
 # Datails page or Database interface is run on this page based on flag
-try:
-    if st.session_state.display_details_page_knowledge:
-        details_page()
-    else:
-        db_interface()
-except Exception as e:
-    st_logger.error(e)
-    st.error(st.session_state.translator("⚠️Something went wrong, try again later⚠️"))
+# Page runs as fragment, so switching between details page and database interface
+# does not rerun the whole app (navigation, sidebar)
+@st.fragment
+def page():
+    try:
+        if st.session_state.display_details_page_knowledge:
+            details_page()
+        else:
+            db_interface()
+    except Exception as e:
+        st_logger.error(e)
+        st.error(st.session_state.translator("⚠️Something went wrong, try again later⚠️"))
+
+
+page()
@@ -1,8 +1,7 @@
 import streamlit as st
 
-from asyncio import run
-
 from src.utils import rag_endpoints
+from src.utils.helpers import run_async_concurrently
 
 
 #Main method of subpage 'Štatistika'
@@ -26,28 +25,46 @@ def statistics():
     if "get_rag_answer" not in st.session_state:
         st.session_state.get_rag_answer = False
 
+    #Placeholders for results and coroutines of enabled endpoint calls
+    placeholders = []
+    requests = []
+
     if st.button("get_status"):
         st.session_state.pressed = True
-    
+
     if st.session_state.pressed:
-        st.success(run(rag_endpoints.get_status()).text)
+        placeholders.append(st.empty())
+        requests.append(rag_endpoints.get_status())
 
     if st.button("test_ingest_text"):
         st.session_state.ingest_text = True
 
     if st.session_state.ingest_text:
-        st.success(run(rag_endpoints.post_ingest_text("Boris lives on planet Earth")).text)
+        placeholders.append(st.empty())
+        requests.append(rag_endpoints.post_ingest_text("Boris lives on planet Earth"))
 
     if st.button("retrieve_data"):
         st.session_state.retrieve_data = True
 
     if st.session_state.retrieve_data:
-        st.success(run(rag_endpoints.get_retrieve_data(text="FEI STU",n_results=2)).text)
+        placeholders.append(st.empty())
+        requests.append(rag_endpoints.get_retrieve_data(text="FEI STU",n_results=2))
 
     if st.button("get_rag_answer"):
         st.session_state.get_rag_answer = True
 
     if st.session_state.get_rag_answer:
-        st.success(run(rag_endpoints.post_get_rag_answer("Kto je dekan?")).text)
-
-statistics()
\ No newline at end of file
+        placeholders.append(st.empty())
+        requests.append(rag_endpoints.post_get_rag_answer("Kto je dekan?"))
+
+    #Send all enabled requests concurrently and display results under their buttons
+    if requests:
+        responses = run_async_concurrently(*requests, return_exceptions=True)
+        for placeholder, response in zip(placeholders, responses):
+            # Failure of one endpoint is displayed only in its own placeholder
+            if isinstance(response, Exception):
+                placeholder.error(f"{type(response).__name__}: {response}")
+            else:
+                placeholder.success(response.text)
+
+statistics()
@@ -7,10 +7,14 @@ from common.logging.st_logger import st_logger
 # Displays title and navigation elements
 def details_page_header():
     st.title(st.session_state.translator("Conversation details"))
-    if st.button(st.session_state.translator("Back")):
-        st.session_state.details_row_index_history = None
-        st.session_state.display_details_page_history = False
-        st.rerun()
+    # Button is inside page fragment, click reruns only the fragment
+    st.button(st.session_state.translator("Back"), on_click=on_back_click)
+
+
+# Callback for 'Back' button, returns to database interface
+def on_back_click() -> None:
+    st.session_state.details_row_index_history = None
+    st.session_state.display_details_page_history = False
 
 
 # Displays actual details of given conversation
@@ -4,10 +4,14 @@ import streamlit as st
 # Displays title and navigation elements
 def details_page_header():
     st.title(st.session_state.translator("Document details"))
-    if st.button(st.session_state.translator("Back")):
-        st.session_state.details_row_index_knowledge = None
-        st.session_state.display_details_page_knowledge = False
-        st.rerun()
+    # Button is inside page fragment, click reruns only the fragment
+    st.button(st.session_state.translator("Back"), on_click=on_back_click)
+
+
+# Callback for 'Back' button, returns to database interface
+def on_back_click() -> None:
+    st.session_state.details_row_index_knowledge = None
+    st.session_state.display_details_page_knowledge = False
 
 
 # Displays actual details of given conversation
@@ -17,10 +17,23 @@ def details_page_header() -> None:
         None
     """
     st.title(st.session_state.translator("Webscraper page details"))
-    if st.button(st.session_state.translator("Back")):
-        st.session_state.details_row_index_webscraper = None
-        st.session_state.display_details_page_webscraper = False
-        st.rerun()
+    # Button is inside page fragment, click reruns only the fragment
+    st.button(st.session_state.translator("Back"), on_click=on_back_click)
+
+
+# Callback for 'Back' button, returns to database interface
+def on_back_click() -> None:
+    """
+    Callback for 'Back' button, returns to database interface
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    st.session_state.details_row_index_webscraper = None
+    st.session_state.display_details_page_webscraper = False
 
 
 # Displays actual details of given conversation
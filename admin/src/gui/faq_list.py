@@ -1,10 +1,27 @@
 import streamlit as st
-import json
-
-from asyncio import run
+import orjson
 
 from common.logging.st_logger import st_logger
 import src.utils.rag_endpoints as endpoints
+from src.utils.helpers import run_async
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_faq_list(collection: str, num_of_rows: int) -> list:
+    """
+    Load FAQ records from the API. Result is cached, so reruns of the page
+    do not repeat the HTTP request.
+
+    Args:
+        collection (str): Name of the collection with FAQ records
+        num_of_rows (int): Number of records to be loaded
+
+    Returns:
+        list: List of FAQ records (dictionaries with question and answer)
+    """
+    response = run_async(endpoints.post_faq_random_questions(collection, num_of_rows))
+    faq_list = orjson.loads(response.content)
+    return faq_list[0]["result"]
+
 
 def faq_list_display(num_of_rows: int = 1000) -> None:
     """
@@ -16,10 +33,8 @@ def faq_list_display(num_of_rows: int = 1000) -> None:
     Returns:
         None
     """
-    response = run(endpoints.post_faq_random_questions("faq", num_of_rows))
-    faq_list = json.loads(response.text)
     try:
-        questions_list = faq_list[0]["result"]
+        questions_list = load_faq_list("faq", num_of_rows)
     except Exception as e:
         st_logger.error("Error during loading of faq list: " + str(e))
         st.title(st.session_state.translator("🔍The list is empty"))
@@ -45,8 +60,9 @@ def on_click_delete_faq_question(question: str) -> None:
     Returns:
 
     """
-    response = run(endpoints.delete_delete_one_chroma_record(collection_name="faq", filter={"question": question}))
+    response = run_async(endpoints.delete_delete_one_chroma_record(collection_name="faq", filter={"question": question}))
     if endpoints.is_api_call_successful(response):
+        load_faq_list.clear()
         st.toast(st.session_state.translator("Delete process finished ✔"))
         st_logger.info(f"Deleted successfully faq: '{question}'")  
     else:
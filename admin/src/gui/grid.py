@@ -1,25 +1,36 @@
+import numpy as np
 import streamlit as st
 
 import src.gui.selection_buttons as btn
-from src.utils.mongodb_adapter import create_dataset_from_mongodb
+from src.utils.mongodb_adapter import get_dataset, get_pages_count
 
 
-def print_dataframe(collection: str, query: dict = None) -> None:
+def print_dataframe(collection: str, query: dict = None, batch_size: int = 0) -> None:
     """
     Function that prints a table with formated MongoDB records based on the collection and query provided.
-    If no query is provided, all records from the collection are printed. Initialisation of the dataframe
-    and saving it to the session state is done only once.
+    If no query is provided, all records from the collection are printed (one page at a time).
+    The dataframe is loaded from the cache shared across sessions and saved to the session state.
 
     Args:   
         collection (str): Name of the collection where the records are stored
         query (dict): Dictionary containing the query to be executed. Default is None
+        batch_size (int): Number of records fetched from MongoDB in one batch. Default is 0 (whole page in one batch)
 
     Returns:
         None
     """
-    # If not loaded, load dataset 
-    if ('dataset_' + collection) not in st.session_state:
-        st.session_state['dataset_' + collection] = create_dataset_from_mongodb(collection, query)
+    # Records are loaded from MongoDB by pages, pager is displayed only if there is more than one page
+    pages_count = get_pages_count(collection, query)
+    if pages_count > 1:
+        # Selected page may not exist anymore (e.g. after deleting of records)
+        if st.session_state.get('page_' + collection, 1) > pages_count:
+            st.session_state['page_' + collection] = pages_count
+        page = st.number_input(st.session_state.translator("Page"), min_value=1, max_value=pages_count, key='page_' + collection)
+    else:
+        page = 1
+
+    # Load dataset (MongoDB is queried only if the dataset is not cached)
+    st.session_state['dataset_' + collection] = get_dataset(collection, query, batch_size, page - 1)
     
     build_table(collection, st.session_state['dataset_' + collection])
 
@@ -36,14 +47,20 @@ def build_table(collection: str, df: object) -> None:
     Returns:
         None
     """
-    # Placeholder for action buttons on selected rows
-    selection_actions_placeholder = st.columns([1,1,1,1,1,1])
+    # Placeholder for action buttons on selected rows (only columns for used buttons + spacer)
+    if collection == "webscraper":
+        selection_actions_placeholder = st.columns([1,1,4])
+    else:
+        selection_actions_placeholder = st.columns([1,1,1,3])
     with selection_actions_placeholder[0]:
         st.markdown(st.session_state.translator("Selection actions:"))
 
-    grid = st.dataframe(df, column_config={"ID":None}, on_select='rerun',  selection_mode='multi-row')
+    # Hidden ID column is not sent to the browser at all (ObjectIds cannot be serialized to Arrow directly)
+    grid = st.dataframe(df.drop(columns="ID"), on_select='rerun',  selection_mode='multi-row')
 
-    build_selection_buttons(collection, selection_actions_placeholder, df, grid.selection['rows'], disabled=is_selection_empty(grid))
+    # Selected rows are passed to the buttons as one array, buttons are disabled for empty selection
+    selected_rows = np.asarray(grid.selection['rows'], dtype=np.int64)
+    build_selection_buttons(collection, selection_actions_placeholder, df, selected_rows, disabled=not grid.selection['rows'])
     if grid.selection['rows']:
         build_details_buttons(collection, df, grid.selection['rows'])
 
@@ -56,7 +73,7 @@ def build_selection_buttons(collection: str, columns: st.columns, df: object, se
         collection (str): Name of the collection where the records are stored
         columns (st.columns): Streamlit columns object
         df (object): pandas DataFrame object containing the records from MongoDB
-        selected_rows (list): List of selected row indexes
+        selected_rows (np.ndarray): Array of selected row indexes
         disabled (bool): Flag for disabling the buttons. Default is False
 
     Returns:
@@ -102,17 +119,26 @@ def build_details_buttons(collection: str, df: object, selected_rows: list) -> N
         None
     """
     st.markdown(st.session_state.translator("Selected:"))
-    for selected_row_index in selected_rows:
-        display_selected(collection, df, selected_row_index)
-
-
-def display_selected(collection: str, df: object, selected_row_index: int) -> None:
+    # Column with titles is resolved once for all selected rows
+    match collection:
+        case "history":
+            title_column = st.session_state.translator('Description')
+        case "webscraper":
+            title_column = st.session_state.translator('Web description')
+        case _:
+            title_column = st.session_state.translator('Name')
+    labels = df[title_column].iloc[selected_rows].tolist()
+    for label, selected_row_index in zip(labels, selected_rows):
+        display_selected(collection, label, selected_row_index)
+
+
+def display_selected(collection: str, label: str, selected_row_index: int) -> None:
     """
     Displays one row of the selected record in the Details section.
     
     Args:
         collection (str): Name of the collection where the records are stored
-        df (object): pandas DataFrame object containing the records from MongoDB
+        label (str): Title of the selected record
         selected_row_index (int): Index of the selected row in the DataFrame
 
     Returns:
@@ -120,15 +146,7 @@ def display_selected(collection: str, df: object, selected_row_index: int) -> No
     """
     columns = st.columns([3,1])
     with columns[0]:
-        match collection:
-            case "history":
-                st.write(df.iloc[selected_row_index][st.session_state.translator('Description')])
-            case "knowledge":
-                st.write(df.iloc[selected_row_index][st.session_state.translator('Name')])
-            case "webscraper":
-                st.write(df.iloc[selected_row_index][st.session_state.translator('Web description')])
-            case _:
-                st.write(df.iloc[selected_row_index][st.session_state.translator('Name')])
+        st.write(label)
     with columns[1]:
         st.button(
             label=st.session_state.translator("Details"),
@@ -153,18 +171,3 @@ def on_details_click(collection: str, selected_row_index: int) -> None:
     # Flag to display details page + index of row for printing correct data
     st.session_state['display_details_page_' + collection] = True
     st.session_state['details_row_index_' + collection] = selected_row_index
-    
-
-def is_selection_empty(grid: object) -> bool:
-    """
-    Function that checks if the selection in the grid is empty.
-    Used for disabling the selection action buttons.
-
-    Args:
-        grid (object): Streamlit dataframe object
-
-    Returns:
-        bool: True if the selection is empty, False otherwise
-    """
-    return not(bool(len(grid.selection['rows'])))
- 
\ No newline at end of file
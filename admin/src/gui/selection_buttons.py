@@ -1,88 +1,201 @@
+import asyncio
+import pandas as pd
 import streamlit as st
 
 import src.utils.rag_endpoints as endpoints
 from common.logging.st_logger import st_logger
 
-from asyncio import run
-from src.utils.helpers import get_rec_id, get_rec_descriptor
-from src.utils.mongodb_adapter import delete_record, update_record_element, load_record, create_dataset_from_mongodb
+from src.utils.helpers import get_rec_descriptor_column, run_async, gather_bounded
+from common.session.db_connection import mongo_db
+from src.utils.mongodb_adapter import delete_many_records, update_many_records_element, load_record, reload_dataset
+
+
+def get_selected_records(collection: str, df: object, selected_rows: list) -> list:
+    """
+    Get IDs, descriptors and row data of records in selected rows of DataFrame.
+    Values are taken from whole columns at once, not cell by cell.
+
+    Args:
+        collection (str): Name of collection in MongoDB
+        df (object): pandas DataFrame object with records
+        selected_rows (np.ndarray): Array of selected rows in DataFrame
+
+    Returns:
+        list: List of (record ID, record descriptor, row) tuples, row is dictionary of DataFrame columns
+    """
+    selected_df = df.iloc[selected_rows]
+    rec_ids = selected_df['ID'].tolist()
+    rec_descriptors = selected_df[get_rec_descriptor_column(collection)].tolist()
+    return list(zip(rec_ids, rec_descriptors, selected_df.to_dict('records')))
+
+
+def report_failures(message: str, failures: list, max_listed: int = 5) -> None:
+    """
+    Display one toast with descriptors of records whose action failed.
+
+    Args:
+        message (str): Message displayed before the descriptors (translated)
+        failures (list): Descriptors of records whose action failed
+        max_listed (int): Maximal number of listed descriptors. Default is 5
+
+    Returns:
+        None
+    """
+    if failures:
+        listed = ", ".join(str(failure) for failure in failures[:max_listed])
+        st.toast(st.session_state.translator(message) + listed + ("…" if len(failures) > max_listed else ""))
+
+
+def update_ingested_flags(rec_ids: list, ingested: bool, collection: str) -> None:
+    """
+    Update 'ingested' flags of records after learning or unlearning by one bulk request.
+
+    Args:
+        rec_ids (list): IDs of records in MongoDB
+        ingested (bool): New value of the flag
+        collection (str): Name of collection in MongoDB
+
+    Returns:
+        None
+    """
+    try:
+        update_many_records_element(rec_ids, 'ingested', ingested, collection)
+    except Exception as e:
+        st_logger.error(f"Error during updating of 'ingested' flags in '{collection}': {e}")
+        st.toast(st.session_state.translator("⚠️Error during updating of records"))
+
+
+async def is_ingested(rec_id: str, collection: str, row: dict = None) -> bool:
+    """
+    Get 'ingested' flag of record. The flag is taken from DataFrame row,
+    MongoDB is queried (in worker thread) only if the row does not contain it.
+
+    Args:
+        rec_id (str): ID of record in MongoDB
+        collection (str): Name of collection in MongoDB
+        row (dict): Row of DataFrame with record. Default is None
+
+    Returns:
+        bool: True if the record is ingested
+    """
+    ingested = row.get(st.session_state.translator('Ingested')) if row else None
+    if ingested is None or pd.isna(ingested):
+        record = await asyncio.to_thread(load_record, rec_id, collection, ["header.ingested"])
+        ingested = record['header']['ingested']
+    return bool(ingested)
 
 
 def delete_btn(collection: str, df: object, selected_rows: list) -> None:
     """
     Delete records from MongoDB based on selected rows in DataFrame.
-    Common steps for all collections.
+    Common steps for all collections. Records are removed from MongoDB
+    by one bulk request after collection specific steps (API calls) succeeded.
 
     Args:
         collection (str): Name of collection in MongoDB
         df (object): pandas DataFrame object with records
-        selected_rows (list): List of selected rows in DataFrame
+        selected_rows (np.ndarray): Array of selected rows in DataFrame
 
     Returns:
         None
     """
-    for selected_row_index in selected_rows:
-        rec_id = get_rec_id(df, selected_row_index)
-        rec_descriptor = get_rec_descriptor(collection, df, selected_row_index)
-        st_logger.debug(f"Started deleting '{rec_descriptor}' with ID: {rec_id}")
-        try:
-            delete_one_record(collection, rec_id, rec_descriptor)
-            st_logger.info(f"Deleted '{rec_descriptor}' with ID: {rec_id}")
-        except Exception as e:
+    records = get_selected_records(collection, df, selected_rows)
+    st_logger.debug(f"Started deleting {len(records)} records from '{collection}'")
+    # Collection specific step is resolved once, API calls of all records are sent concurrently
+    delete_one_record = DELETE_ONE_RECORD[collection]
+    results = run_async(gather_bounded(
+        [delete_one_record(rec_id, rec_descriptor, row) for rec_id, rec_descriptor, row in records],
+        return_exceptions=True
+    ))
+
+    # IDs of records ready to be removed from MongoDB
+    rec_ids_to_delete = []
+    # Descriptors of records whose action failed, reported by one toast
+    failures = []
+    for (rec_id, rec_descriptor, _), result in zip(records, results):
+        if isinstance(result, Exception):
             st_logger.error(f"Error during deleting of item ID: {rec_id} {rec_descriptor}")  
-            st.toast(st.session_state.translator(f"⚠️Error during deleting of: {rec_descriptor}"))
+            failures.append(rec_descriptor)
+        else:
+            rec_ids_to_delete.append(rec_id)
+
+    report_failures("⚠️Error during deleting of: ", failures)
+
+    try:
+        delete_many_records(rec_ids_to_delete, collection)
+        st_logger.info(f"Deleted {len(rec_ids_to_delete)} records from '{collection}': {rec_ids_to_delete}")
+    except Exception as e:
+        st_logger.error(f"Error during deleting of items from '{collection}': {e}")
+        st.toast(st.session_state.translator("⚠️Error during deleting of records"))
             
-    st.session_state['dataset_' + collection] = create_dataset_from_mongodb(collection)
+    reload_dataset(collection)
     st.toast(st.session_state.translator("Delete process finished ✔"))
 
 
-def delete_one_record(collection: str, rec_id: str, rec_descriptor: str) -> None:
+async def skip_record(rec_id: str, rec_descriptor: str, row: dict = None) -> None:
     """
-    Delete one record from MongoDB based on selected row in DataFrame.
-    Specific logic for each collection.
+    Collection specific step for collections where the action needs no API call.
 
     Args:
-        collection (str): Name of collection in MongoDB
         rec_id (str): ID of record in MongoDB
         rec_descriptor (str): Descriptor of record (filename, description, URL, etc.)
+        row (dict): Row of DataFrame with record. Default is None
+
+    Returns:
+        None
+    """
+    pass
+
+
+async def delete_knowledge_record(rec_id: str, rec_descriptor: str, row: dict = None) -> None:
+    """
+    Prepare one knowledge record for deletion from MongoDB. If the document
+    is ingested, it is unlearned (removed from Chroma via API) first.
+    Record itself is removed from MongoDB afterwards by 'delete_btn'.
+
+    Args:
+        rec_id (str): ID of record in MongoDB
+        rec_descriptor (str): Descriptor of record (filename)
+        row (dict): Row of DataFrame with record. Default is None
+
+    Returns:
+        None
+
+    Raises:
+        Exception: If the API call failed and the record must not be deleted from MongoDB
+    """
+    if await is_ingested(rec_id, "knowledge", row):
+        response = await endpoints.delete_delete_data(file_name=rec_descriptor)
+        # Record is deleted right after, so its 'ingested' flag is not updated
+        if endpoints.is_api_call_successful(response):
+            st_logger.info(response.text)
+        else:
+            st_logger.error(f"API error: {response.text}")
+            raise Exception(f"API error: {response.text}")
+
+
+async def delete_webscraper_record(rec_id: str, rec_descriptor: str, row: dict = None) -> None:
+    """
+    Prepare one webscraper record for deletion from MongoDB by deleting the page from Chroma.
+    Record itself is removed from MongoDB afterwards by 'delete_btn'.
+
+    Args:
+        rec_id (str): ID of record in MongoDB
+        rec_descriptor (str): Descriptor of record (URL)
+        row (dict): Row of DataFrame with record. Default is None
 
     Returns:
         None
+
+    Raises:
+        Exception: If the API call failed and the record must not be deleted from MongoDB
     """
-    match collection:
-        case 'knowledge':
-            # If the document is ingested, unlearn it and delete from Mongo
-            record = load_record(rec_id, "knowledge")
-            if record['header']['ingested']:
-                response = run(endpoints.delete_delete_data(file_name=rec_descriptor))
-                if endpoints.is_api_call_successful(response):
-                    st_logger.info(response.text)
-                    update_record_element(rec_id, 'ingested', False, "knowledge")
-                    delete_record(rec_id, "knowledge")
-                else:
-                    st_logger.error(f"API error: {response.text}")
-                    raise Exception(f"API error: {response.text}")
-            else:
-                # Remove the document from Mongo if it is not ingested
-                delete_record(rec_id, "knowledge")
-
-        case 'history':
-            delete_record(rec_id, "history")
-
-        case 'webscraper':
-            # Delete page from Chroma
-            response = run(endpoints.delete_delete_one_chroma_record(collection_name='webscraper', filter={"url" : rec_descriptor}))
-            if endpoints.is_api_call_successful(response):
-                # Delete page from Mongo
-                response = run(endpoints.delete_delete_one_mongo_record(collection_name='webscraper', _id=rec_id))
-                if endpoints.is_api_call_successful(response):
-                    st_logger.debug(response.text)
-                else:
-                    st_logger.error(f"API error during deleting of '{rec_descriptor}' from Mongo: {response.text}")
-                    raise Exception(f"API error Mongo: {response.text}")
-            else:
-                st_logger.error(f"API error during deleting of '{rec_descriptor}' from Chroma: {response.text}")
-                raise Exception(f"API error Chroma: {response.text}")
+    response = await endpoints.delete_delete_one_chroma_record(collection_name='webscraper', filter={"url" : rec_descriptor})
+    if endpoints.is_api_call_successful(response):
+        st_logger.debug(response.text)
+    else:
+        st_logger.error(f"API error during deleting of '{rec_descriptor}' from Chroma: {response.text}")
+        raise Exception(f"API error Chroma: {response.text}")
 
 
 def unlearn_btn(collection: str, df: object, selected_rows: list) -> None:
@@ -94,57 +207,60 @@ def unlearn_btn(collection: str, df: object, selected_rows: list) -> None:
     Args:
         collection (str): Name of collection in MongoDB
         df (object): pandas DataFrame object with records
-        selected_rows (list): List of selected rows in DataFrame
+        selected_rows (np.ndarray): Array of selected rows in DataFrame
 
     Returns:
         None
     """
-    for selected_row_index in selected_rows:
-        rec_id = get_rec_id(df, selected_row_index)
-        rec_descriptor = get_rec_descriptor(collection, df, selected_row_index)
-        st_logger.debug(f"Started unlearning '{rec_descriptor}' with ID: {rec_id}")
-        try:
-            unlearn_one_record(collection, rec_id, rec_descriptor)
+    records = get_selected_records(collection, df, selected_rows)
+    st_logger.debug(f"Started unlearning {len(records)} records from '{collection}'")
+    # Collection specific step is resolved once, API calls of all records are sent concurrently
+    unlearn_one_record = UNLEARN_ONE_RECORD[collection]
+    results = run_async(gather_bounded(
+        [unlearn_one_record(rec_id, rec_descriptor, row) for rec_id, rec_descriptor, row in records],
+        return_exceptions=True
+    ))
+
+    # IDs of unlearned records, their 'ingested' flags are updated by one bulk request
+    rec_ids_to_update = []
+    # Descriptors of records whose action failed, reported by one toast
+    failures = []
+    for (rec_id, rec_descriptor, _), result in zip(records, results):
+        if not isinstance(result, Exception):
             st_logger.info(f"Unlearned '{rec_descriptor}' with ID: {rec_id}")
-        except Exception as e:
+            if result is True:
+                rec_ids_to_update.append(rec_id)
+        else:
             st_logger.error(f"Error during unlearning of item ID: {rec_id} {rec_descriptor}")  
-            st.toast(st.session_state.translator(f"⚠️Error during unlearning of: {rec_descriptor}"))
+            failures.append(rec_descriptor)
+    report_failures("⚠️Error during unlearning of: ", failures)
+    update_ingested_flags(rec_ids_to_update, False, collection)
             
-    st.session_state['dataset_' + collection] = create_dataset_from_mongodb(collection)
+    reload_dataset(collection)
     st.toast(st.session_state.translator("Unlearn process finished ✔"))
 
 
-def unlearn_one_record(collection: str, rec_id: str, rec_descriptor: str) -> None:
+async def unlearn_knowledge_record(rec_id: str, rec_descriptor: str, row: dict = None) -> bool:
     """
-    Unlearn one record from MongoDB based on selected row in DataFrame.
-    Specific logic for each collection.
+    Unlearn one knowledge record (remove it from Chroma via API), if it is ingested.
+    Its 'ingested' flag is updated afterwards by 'unlearn_btn'.
 
     Args:
-        collection (str): Name of collection in MongoDB
         rec_id (str): ID of record in MongoDB
-        rec_descriptor (str): Descriptor of record (filename, description, URL, etc.)
+        rec_descriptor (str): Descriptor of record (filename)
+        row (dict): Row of DataFrame with record. Default is None
 
     Returns:
-        None
+        bool: True if the record was unlearned and its 'ingested' flag has to be updated
     """
-    match collection:
-        case 'knowledge':
-            record = load_record(rec_id, "knowledge")
-            # If the document is ingested, unlearn it
-            if record['header']['ingested']:
-                response = run(endpoints.delete_delete_data(file_name=rec_descriptor))
-                if endpoints.is_api_call_successful(response):
-                    update_record_element(rec_id, 'ingested', False, "knowledge")
-                    st_logger.debug(response.text)
-                else:
-                    st_logger.error(f"API error: {response.text}")
-                    raise Exception(f"API error: {response.text}")
-
-        case 'history':
-            pass
-
-        case 'webscraper':
-            pass
+    if await is_ingested(rec_id, "knowledge", row):
+        response = await endpoints.delete_delete_data(file_name=rec_descriptor)
+        if endpoints.is_api_call_successful(response):
+            st_logger.debug(response.text)
+            return True
+        else:
+            st_logger.error(f"API error: {response.text}")
+            raise Exception(f"API error: {response.text}")
 
 
 def learn_btn(collection: str, df: object, selected_rows: list) -> None:
@@ -156,65 +272,121 @@ def learn_btn(collection: str, df: object, selected_rows: list) -> None:
     Args:
         collection (str): Name of collection in MongoDB
         df (object): pandas DataFrame object with records
-        selected_rows (list): List of selected rows in DataFrame
+        selected_rows (np.ndarray): Array of selected rows in DataFrame
 
     Returns:
         None
     """
-    for selected_row_index in selected_rows:
-        rec_id = get_rec_id(df, selected_row_index)
-        rec_descriptor = get_rec_descriptor(collection, df, selected_row_index)
-        st_logger.debug(f"Started learning '{rec_descriptor}' with ID: {rec_id}")
-        try:
-            learn_one_record(collection, rec_id, rec_descriptor)
+    records = get_selected_records(collection, df, selected_rows)
+    st_logger.debug(f"Started learning {len(records)} records from '{collection}'")
+    # Collection specific step is resolved once, API calls of all records are sent concurrently
+    learn_one_record = LEARN_ONE_RECORD[collection]
+    results = run_async(gather_bounded(
+        [learn_one_record(rec_id, rec_descriptor, row) for rec_id, rec_descriptor, row in records],
+        return_exceptions=True
+    ))
+
+    # IDs of learned records, their 'ingested' flags are updated by one bulk request
+    rec_ids_to_update = []
+    # Descriptors of records whose action failed, reported by one toast
+    failures = []
+    for (rec_id, rec_descriptor, _), result in zip(records, results):
+        if not isinstance(result, Exception):
             st_logger.info(f"Learned '{rec_descriptor}' with ID: {rec_id}")
-        except Exception as e:
+            if result is True:
+                rec_ids_to_update.append(rec_id)
+        else:
             st_logger.error(f"Error during learning of item ID: {rec_id} {rec_descriptor}")
-            st.toast(st.session_state.translator(f"⚠️Error during learning of: {rec_descriptor}"))
+            failures.append(rec_descriptor)
+    report_failures("⚠️Error during learning of: ", failures)
+    update_ingested_flags(rec_ids_to_update, True, collection)
             
-    st.session_state['dataset_' + collection] = create_dataset_from_mongodb(collection)
+    reload_dataset(collection)
     st.toast(st.session_state.translator("Learn process finished ✔"))
 
 
-def learn_one_record(collection: str, rec_id: str, rec_descriptor: str) -> None:
+def open_knowledge_record(rec_id: str) -> dict:
     """
-    Learn one record from MongoDB based on selected row in DataFrame.
-    Specific logic for each collection.
+    Load knowledge record to be ingested and open its content.
+    Runs in worker thread, so it must not use Streamlit.
 
     Args:
-        collection (str): Name of collection in MongoDB
         rec_id (str): ID of record in MongoDB
-        rec_descriptor (str): Descriptor of record (filename, description, URL, etc.)
+
+    Returns:
+        dict: File to be sent to API (see 'endpoints.convert_file_to_UploadFile')
+    """
+    record = load_record(rec_id, "knowledge", fields=["content", "content_ref", "header.file_name", "header.type"])
+    # Content stored in GridFS is streamed to API, older records hold it inline
+    content = mongo_db.open_file(record['content_ref']) if 'content_ref' in record else record['content']
+    return endpoints.convert_file_to_UploadFile(content, record['header']['file_name'], record['header']['type'])
+
+
+async def learn_knowledge_record(rec_id: str, rec_descriptor: str, row: dict = None) -> bool:
+    """
+    Learn one knowledge record (ingest it to Chroma via API), if it is not ingested yet.
+    Its 'ingested' flag is updated afterwards by 'learn_btn'.
+
+    Args:
+        rec_id (str): ID of record in MongoDB
+        rec_descriptor (str): Descriptor of record (filename)
+        row (dict): Row of DataFrame with record. Default is None
+
+    Returns:
+        bool: True if the record was learned and its 'ingested' flag has to be updated
+    """
+    # Content of the document is loaded only if it is going to be ingested
+    # Blocking MongoDB calls run in worker thread, so records are processed concurrently
+    if not await is_ingested(rec_id, "knowledge", row):
+        file = await asyncio.to_thread(open_knowledge_record, rec_id)
+        response = await endpoints.post_ingest_file(file)
+        if endpoints.is_api_call_successful(response):
+            st_logger.debug(response.text)
+            return True
+        else:
+            st_logger.error(f"API error: {response.text}")
+            raise Exception(f"API error: {response.text}")
+
+
+async def learn_history_record(rec_id: str, rec_descriptor: str, row: dict = None) -> None:
+    """
+    Learn one history record. Previous conversation history is not ingested.
+
+    Args:
+        rec_id (str): ID of record in MongoDB
+        rec_descriptor (str): Descriptor of record (description)
+        row (dict): Row of DataFrame with record. Default is None
 
     Returns:
         None
     """
-    match collection:
-        case 'knowledge':
-            record = load_record(rec_id, "knowledge")
-            if not record['header']['ingested']:
-                file = endpoints.convert_file_to_UploadFile(record['content'], record['header']['file_name'], record['header']['type'])
-                response = run(endpoints.post_ingest_file(file))
-                if endpoints.is_api_call_successful(response):
-                    update_record_element(rec_id, 'ingested', True, "knowledge")
-                    st_logger.debug(response.text)
-                else:
-                    st_logger.error(f"API error: {response.text}")
-                    raise Exception(f"API error: {response.text}")
-
-        case 'history':
-            # previous conversation history is not ingested
-            pass
-            # record = load_record(rec_id, "history")
-            # if not record['header']['ingested']:
-            #     response = run(endpoints.post_ingest_text(str(record['conversation_content'])))
-            #     if endpoints.is_api_call_successful(response):
-            #         update_record_element(rec_id, 'ingested', True, "history")
-            #         st_logger.debug(response.text)
-            #     else:
-            #         st_logger.error("API error: " + response.text)
-            #         raise Exception(f"API error: {response.text}")
-
-        case 'webscraper':
-            pass
-        
\ No newline at end of file
+    pass
+    # record = load_record(rec_id, "history")
+    # if not record['header']['ingested']:
+    #     response = await endpoints.post_ingest_text(str(record['conversation_content']))
+    #     if endpoints.is_api_call_successful(response):
+    #         update_record_element(rec_id, 'ingested', True, "history")
+    #         st_logger.debug(response.text)
+    #     else:
+    #         st_logger.error("API error: " + response.text)
+    #         raise Exception(f"API error: {response.text}")
+
+
+# Collection specific steps of selection actions, resolved once per action (not per record)
+DELETE_ONE_RECORD = {
+    'knowledge': delete_knowledge_record,
+    'history': skip_record,
+    'webscraper': delete_webscraper_record,
+}
+
+UNLEARN_ONE_RECORD = {
+    'knowledge': unlearn_knowledge_record,
+    'history': skip_record,
+    'webscraper': skip_record,
+}
+
+LEARN_ONE_RECORD = {
+    'knowledge': learn_knowledge_record,
+    'history': learn_history_record,
+    'webscraper': skip_record,
+}
@@ -8,12 +8,27 @@ def create():
     apply_style_navigation()
 
     with st.sidebar:
+        language_switcher()
 
-        #Create buttons for language switching
-        spacer1,col1,col2,spacer2 = st.columns([1.2,1.5,1.5,1.2],gap="small",vertical_alignment="top")
 
-        with col1:
-            st.button("SK",help="Slovenčina",on_click=set_language,args=("sk",),type="primary",key="slovak",use_container_width=True)
+#Buttons for language switching, click on them reruns only this fragment
+@st.fragment
+def language_switcher():
 
-        with col2:
-            st.button("EN",help="English",on_click=set_language,args=("en",),type="primary",key="english",use_container_width=True)
\ No newline at end of file
+    #Create buttons for language switching
+    spacer1,col1,col2,spacer2 = st.columns([1.2,1.5,1.5,1.2],gap="small",vertical_alignment="top")
+
+    with col1:
+        if st.button("SK",help="Slovenčina",type="primary",key="slovak",use_container_width=True):
+            change_language("sk")
+
+    with col2:
+        if st.button("EN",help="English",type="primary",key="english",use_container_width=True):
+            change_language("en")
+
+
+#Sets new language and reruns whole app to translate it, nothing happens if the language is already set
+def change_language(language):
+    if language != st.session_state.get("session_lang"):
+        set_language(language)
+        st.rerun()
@@ -1,64 +1,31 @@
 import streamlit as st
-import streamlit.components.v1 as components
 
+from functools import lru_cache
+from string import Template
+from src.session.translations import get_translator
 
-#Function that defines styles for chat app sidebar pages navigation
-def apply_style_navigation():
 
-    #Custom CSS style for st.navigation() method
-    navbutton_pressed_css = """
+#Custom CSS style for st.navigation() method (pressed/released buttons, menu header and logout icon)
+NAVIGATION_CSS = """
 
         <style>
         .st-emotion-cache-1rtdyuf {
             color: #E6EBF6;
         }
-        </style>
-        """
-
-    st.markdown(navbutton_pressed_css,unsafe_allow_html=True)
-
-     #Custom CSS style for st.navigation() method
-    navbutton_released_css = """
-
-        <style>
         .st-emotion-cache-2s0is {
             color: #E6EBF6;
         }
-        </style>
-        """
-
-    st.markdown(navbutton_released_css,unsafe_allow_html=True)
-
-    #Custom CSS style for st.navigation() method
-    navmenu_header_css = """
-
-        <style>
         .st-emotion-cache-1n7fb9x {
             color: red;
         }
-        </style>
-        """
-
-    st.markdown(navmenu_header_css,unsafe_allow_html=True)
-
-    #Custom CSS style for st.navigation() method
-    logout_icon_css = """
-
-        <style>
         span[data-testid="stIconMaterial"] {
             color: white !important;         
         }
         </style>
         """
-    
-    st.markdown(logout_icon_css,unsafe_allow_html=True)
-
-
-#Function that defines styles for sidebar logo and page icon
-def apply_style_logo():
 
-    #Custom CSS style for st.logo() method
-    logo_size_css = """
+#Custom CSS style for st.logo() method
+LOGO_CSS = """
         <style>
             img[data-testid="stLogo"] {
                 max-width: calc(259px - 1.5rem);
@@ -66,53 +33,21 @@ def apply_style_logo():
             }
         </style>
         """
-    
-    st.markdown(logo_size_css,unsafe_allow_html=True)
-
-
-#Function that defines styles for st.file_uploader()
-def apply_style_file_uploader(webscraper:bool=False):
 
-    #Custom CSS style for  st.file_uploader() method
-    uploader_css = """
+#Custom CSS style for st.file_uploader() method (text, info, icon) and CSS mask for multilingual support in uploader widgets
+#Translated texts are filled into the template in one pass
+UPLOADER_CSS = Template("""
 
         <style>
         .st-emotion-cache-1fttcpj {
             color: #E6EBF6;
         }
-        </style>
-        """
-
-    st.markdown(uploader_css,unsafe_allow_html=True)
-
-    #Custom CSS style for  st.file_uploader() method
-    uploader_info_css = """
-
-        <style>
         .st-emotion-cache-1u5bms5 {
             color: #abdbe3;
         }
-        </style>
-        """
-
-    st.markdown(uploader_info_css,unsafe_allow_html=True)
-
-    #Custom CSS style for  st.file_uploader() method
-    uploader_icon_css = """
-
-        <style>
         svg {
             fill: #E6EBF6 !important;
         }
-        </style>
-        """
-
-    st.markdown(uploader_icon_css,unsafe_allow_html=True)
-
-    #CSS mask for multilingual support in uploadere widgets
-    uploader_translate_css = """
-
-        <style>
             div[data-testid="stFileUploader"] > section[data-testid="stFileUploaderDropzone"] > button[data-testid="baseButton-secondary"] {
                 color: white !important; /* Original text is displayed, but it is white */
                 background-color: white !important; 
@@ -127,7 +62,7 @@ def apply_style_file_uploader(webscraper:bool=False):
                 position: relative; 
             }
             div[data-testid="stFileUploader"] > section[data-testid="stFileUploaderDropzone"] > button[data-testid="baseButton-secondary"]::after {
-                content: "BUTTON_TEXT";
+                content: "${BUTTON_TEXT}";
                 color: #0039A6 !important;
                 display: block;
                 position: absolute;
@@ -143,7 +78,7 @@ def apply_style_file_uploader(webscraper:bool=False):
                color: #E6EBF6 !important;
             }
             div[data-testid="stFileUploaderDropzoneInstructions"]>div>span::after {
-               content:"INSTRUCTIONS_TEXT";
+               content:"${INSTRUCTIONS_TEXT}";
                visibility:visible;
                display:block;
             }
@@ -151,30 +86,52 @@ def apply_style_file_uploader(webscraper:bool=False):
                visibility:hidden;
             }
             div[data-testid="stFileUploaderDropzoneInstructions"]>div>small::before {
-               content:"FILE_LIMITS";
+               content:"${FILE_LIMITS}";
                visibility:visible;
                display:block;
             }
          </style>
-        """.replace("BUTTON_TEXT", st.session_state.translator("Browse files")).replace("INSTRUCTIONS_TEXT", st.session_state.translator("Drag and drop file here")).replace("FILE_LIMITS", st.session_state.translator("Limit 200MB per file")+(" · CSV" if webscraper else " · PDF, JSON"))
+        """)
 
-    st.markdown(uploader_translate_css, unsafe_allow_html=True)
 
+#Function that defines styles for chat app sidebar pages navigation
+def apply_style_navigation():
+    st.markdown(NAVIGATION_CSS,unsafe_allow_html=True)
+
+
+#Function that defines styles for sidebar logo and page icon
+def apply_style_logo():
+    st.markdown(LOGO_CSS,unsafe_allow_html=True)
+
+
+#Returns translated CSS for st.file_uploader(), built only once per language and uploader type
+@lru_cache(maxsize=16)
+def build_uploader_css(language, webscraper):
+    translator = get_translator(language)
+    return UPLOADER_CSS.substitute(
+        BUTTON_TEXT=translator("Browse files"),
+        INSTRUCTIONS_TEXT=translator("Drag and drop file here"),
+        FILE_LIMITS=translator("Limit 200MB per file")+(" · CSV" if webscraper else " · PDF, JSON")
+    )
 
-#Function that changes size of st.button() element using custom JavaScript
-def change_button_size(widget_label,size_percent):
+
+#Function that defines styles for st.file_uploader()
+def apply_style_file_uploader(webscraper:bool=False):
+    st.markdown(build_uploader_css(st.session_state.session_lang, webscraper), unsafe_allow_html=True)
+
+
+#Function that changes size of st.button() element using custom CSS
+#Button is selected by its key (Streamlit adds class 'st-key-<key>' to the widget container)
+def change_button_size(widget_key,size_percent):
         
-        htmlstr = f"""
-            <script>
-                var elements = window.parent.document.querySelectorAll('button');
-                for (var i = 0; i < elements.length; ++i) {{
-                    if (elements[i].innerText == '{widget_label}') {{
-                        elements[i].style.transform = 'scale({size_percent}%)';
-                    }}
-                }}
-            </script>
+        button_css = f"""
+            <style>
+            .st-key-{widget_key} button {{
+                transform: scale({size_percent}%);
+            }}
+            </style>
             """
-        components.html(f"{htmlstr}", height=0, width=0)
+        st.markdown(button_css,unsafe_allow_html=True)
 
 
 #Function that creates a styled title for chat main page
@@ -191,16 +148,14 @@ def create_main_title(text,align="left",color="#0039A6"):
         </style>
         """
     
-    st.markdown(title_css,unsafe_allow_html=True)
-    
     #Custom HTML for main title of chat page
     title_html =f"""
 
         <h1>{text}</h1>
         """
 
-    #Create custom main title for a chat page
-    st.markdown(title_html,unsafe_allow_html=True)
+    #Create custom main title for a chat page (style and title are sent as one element)
+    st.markdown(title_css + title_html,unsafe_allow_html=True)
 
 
     #Function that creates a styled title for chat main page
@@ -217,16 +172,14 @@ def create_sub_title(text,align="left",color="#0039A6"):
         </style>
         """
     
-    st.markdown(title_css,unsafe_allow_html=True)
-    
     #Custom HTML for main title of chat page
     title_html =f"""
 
         <h2>{text}</h2>
         """
 
-    #Create custom main title for a chat page
-    st.markdown(title_html,unsafe_allow_html=True)
+    #Create custom main title for a chat page (style and title are sent as one element)
+    st.markdown(title_css + title_html,unsafe_allow_html=True)
 
 
 #Custom CSS style for html <input> tag
@@ -1,9 +1,10 @@
 import streamlit as st
 from src.gui.style import apply_style_file_uploader
 from common.session.exceptions import UnsupportedFile
-from src.utils.mongodb_adapter import create_dataset_from_mongodb
+from src.utils.mongodb_adapter import reload_dataset
 from src.utils.upload import process_zip_and_upload, webscraper_form, webscraper_csv_form, faq_form
-from src.utils.mongodb_adapter import upload_file
+from src.utils.mongodb_adapter import upload_files
+from src.gui.faq_list import load_faq_list
 
 
 # Form widget that requires submit button
@@ -21,6 +22,8 @@ def file_upload_widget():
         if submitted and len(uploaded_files):
             # Call for MongoDB communication function
 
+            # Uploaded documents are sent to MongoDB together by one request
+            files_to_upload = []
             try:
                 for file in uploaded_files:
                     if "zip" in file.type:
@@ -29,7 +32,7 @@ def file_upload_widget():
                         file.type == "application/pdf"
                         or file.type == "application/json"
                     ):
-                        upload_file(file, "knowledge")
+                        files_to_upload.append(file)
                     else:
                         raise UnsupportedFile(
                             st.session_state.translator("Unsupported file type !")
@@ -39,11 +42,12 @@ def file_upload_widget():
                 st.error(
                     st.session_state.translator("Error processing file ")
                     + f"'{file.name}': "
-                    + f"{st.session_state.translator(error)}"
+                    + f"{st.session_state.translator(str(error))}"
                 )
 
+            upload_files(files_to_upload, "knowledge")
             uploaded_files = []
-            st.session_state.dataset_knowledge = create_dataset_from_mongodb("knowledge")
+            reload_dataset("knowledge")
 
 
 def webscraper_form_widget() -> None:
@@ -57,7 +61,6 @@ def webscraper_form_widget() -> None:
     Returns:
         None
     """
-
     with st.form(key="admin_webscraper", clear_on_submit=True):
         st.write(st.session_state.translator("Enter information about webpage"))
         url_input = st.text_input(
@@ -76,7 +79,7 @@ def webscraper_form_widget() -> None:
                 st.toast(st.session_state.translator("⚠️Description is empty!"))
                 return
             webscraper_form(url_input, description_input)
-            st.session_state.dataset_webscraper = create_dataset_from_mongodb("webscraper")
+            reload_dataset("webscraper")
 
 
 def webscraper_csv_form_widget() -> None:
@@ -90,7 +93,6 @@ def webscraper_csv_form_widget() -> None:
     Returns:
         None
     """
-
     with st.form(key="admin_webscraper_csv", clear_on_submit=True):
         uploaded_file = st.file_uploader(
             st.session_state.translator("Upload a file in format:    | Description | URL |"),
@@ -104,7 +106,7 @@ def webscraper_csv_form_widget() -> None:
         if submitted and uploaded_file:
             webscraper_csv_form(uploaded_file)
             uploaded_file = None
-            st.session_state.dataset_webscraper = create_dataset_from_mongodb("webscraper")
+            reload_dataset("webscraper")
 
 
 def faq_form_widget() -> None:
@@ -137,3 +139,4 @@ def faq_form_widget() -> None:
                 st.toast(st.session_state.translator("⚠️Answer is empty!"))
                 return
             faq_form(url_input, description_input)
+            load_faq_list.clear()
@@ -1,28 +1,28 @@
 import streamlit as st
-import gettext
 
 import common.session.authentication as auth
 
 from common.session.exceptions import UnauthorizedAccess
-from src.utils.mongodb_adapter import create_dataset_from_mongodb
+from src.session.translations import load_translation, get_translator
+from src.gui.style import build_uploader_css
 
 
 #Function that creates a translator object for given language, based on predefined locales
 def set_language(language):
 
     try:
-        lang_translations = gettext.translation('base', localedir='locales', languages=[language])
+        lang_translations = load_translation(language)
         lang_translations.install()
 		
-        st.session_state.translator = lang_translations.gettext
+        # Translator caches translated messages, shared by all sessions with the same language
+        st.session_state.translator = get_translator(language)
+        # Datasets are loaded for the new language when the tables are displayed
         st.session_state.session_lang = language
 
-        # TODO - hotfix for promo, issue for complex fix created
-        # Create datasets for knowledge and history when language is changed
-        st.session_state.dataset_knowledge = create_dataset_from_mongodb("knowledge")
-        st.session_state.dataset_history = create_dataset_from_mongodb("history")
-        st.session_state.dataset_webscraper = create_dataset_from_mongodb("webscraper")
-    
+        # Translated CSS of file uploaders is built right away, upload widgets only reuse it
+        build_uploader_css(language, False)
+        build_uploader_css(language, True)
+
     except FileNotFoundError as e:
         print(f"FAILED TO SET LOCALES: {e}")
 
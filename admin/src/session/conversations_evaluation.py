@@ -1,6 +1,6 @@
 import streamlit as st
 
-from src.utils.mongodb_adapter import update_record_element
+from src.utils.mongodb_adapter import update_record_elements, load_record
 from src.gui.details_page_history import display_conversation_content
 from common.logging.st_logger import st_logger
 
@@ -18,12 +18,11 @@ def review_flow():
 
     """
     
-    try:
-        conversations_num = st.session_state.review_conversations_buffer.explain().get("executionStats", {}).get("nReturned")
-    except Exception as e:
-        st_logger.error(e)
+    conversations_buffer = st.session_state.review_conversations_buffer
+    if conversations_buffer is None:
         st.write(st.session_state.translator("No conversations for review"))
         return
+    conversations_num = len(conversations_buffer)
 
     st.header(st.session_state.translator("Conversations review"))
     st.text(st.session_state.translator("Number of conversations to be reviewed: ") + str(conversations_num))
@@ -50,17 +49,14 @@ def review_flow():
             on_click=on_next_click
         )
 
-    try:
-        conversation = st.session_state.review_conversations_buffer[st.session_state.review_conversation_index]['conversation_content']
-    except Exception as e:
-        st_logger.error(e)
+    # Displayed conversation is read once, its fields are taken from the local record
+    rec_id = conversations_buffer[st.session_state.review_conversation_index]['_id']
+    conversation_record = load_review_conversation(rec_id) or {}
+    conversation = conversation_record.get('conversation_content')
+    if conversation is None:
+        st_logger.error(f"Conversation {rec_id} has no content")
         st.error(st.session_state.translator("No conversation content to display"))
-        conversation = None
-    try:
-        conversation_review_value = st.session_state.review_conversations_buffer[st.session_state.review_conversation_index]['header']['review']
-    except Exception as e:
-        st_logger.error(e)
-        conversation_review_value = None
+    conversation_review_value = (conversation_record.get('header') or {}).get('review')
 
     if conversation_review_value == 'good':
         st.header(st.session_state.translator("Konverzácia už bola ohodnotená ako DOBRÁ ✅!"))
@@ -77,18 +73,38 @@ def review_flow():
         st.button(
             st.session_state.translator("❌ Bad conversation"),
             disabled=conversation_review_value == 'bad',
-            on_click=on_bad_click,
-            args=[conversations_num]
+            on_click=on_review_click,
+            args=[rec_id, 'bad', conversations_num]
         )
     with col4:
         st.button(
             st.session_state.translator("✅ Good conversation"),
             disabled=conversation_review_value == 'good',
-            on_click=on_good_click,
-            args=[conversations_num]
+            on_click=on_review_click,
+            args=[rec_id, 'good', conversations_num]
         )
 
 
+def load_review_conversation(rec_id: object) -> dict:
+    """
+    Function that loads the displayed conversation from MongoDB. Loaded conversation
+    is kept in session state, so it is not loaded again on every rerun.
+
+    Args:
+        rec_id (ObjectId): ID of the conversation
+
+    Returns:
+        dict: Conversation record (header and content), None if it does not exist
+
+    """
+    cached = st.session_state.get('review_conversation')
+    if cached is None or cached['_id'] != rec_id:
+        record = load_record(rec_id, 'history', fields=['header', 'conversation_content'])
+        cached = {'_id': rec_id, 'record': record}
+        st.session_state.review_conversation = cached
+    return cached['record']
+
+
 def on_next_click():
     """
     Function that updates the session state variable 'review_conversation_index'
@@ -119,62 +135,42 @@ def on_previous_click():
     st.session_state.review_conversation_index -= 1
 
 
-def on_bad_click(conversations_num: int):
+def on_review_click(rec_id: object, review_value: str, conversations_num: int):
     """
-    Function that updates the review value of the conversation to 'bad'
-    when the 'Bad conversation' button is clicked.
+    Function that updates the review value of the conversation ('good' or 'bad')
+    when the 'Good conversation' or 'Bad conversation' button is clicked.
 
     Args:
+        rec_id (ObjectId): ID of the reviewed conversation
+        review_value (str): New review value of the conversation ('good' or 'bad')
         conversations_num (int): Number of conversations in the buffer
 
     Returns:
         None
 
     """
-    rec_id = st.session_state.review_conversations_buffer[st.session_state.review_conversation_index]['_id']
-    update_record_element(
-        rec_id,
-        'review',
-        'bad',
-        'history',
-    )
-    update_record_element(
+    update_record_elements(
         rec_id,
-        'reviewed_by',
-        st.session_state.user_name,
+        {'review': review_value, 'reviewed_by': st.session_state.user_name},
         'history',
     )
+    remove_reviewed_conversation()
     if st.session_state.review_conversation_index >= conversations_num - 1:
         st.session_state.review_conversation_index -= 1
-    st_logger.info(f"Conversation {rec_id} review set to 'good'")
+    st_logger.info(f"Conversation {rec_id} review set to '{review_value}'")
 
 
-def on_good_click(conversations_num: int):
+def remove_reviewed_conversation():
     """
-    Function that updates the review value of the conversation to 'good'
-    when the 'Good conversation' button is clicked.
+    Function that removes the current conversation from the buffer after it was reviewed,
+    so the buffer contains only conversations that have not been reviewed yet
+    (the same conversations as returned by MongoDB).
 
     Args:
-        conversations_num (int): Number of conversations in the buffer
+        None
 
     Returns:
         None
 
-    """ 
-    rec_id = st.session_state.review_conversations_buffer[st.session_state.review_conversation_index]['_id']
-    update_record_element(
-        rec_id,
-        'review',
-        'good',
-        'history',
-    )
-    update_record_element(
-        rec_id,
-        'reviewed_by',
-        st.session_state.user_name,
-        'history',
-    )
-    if st.session_state.review_conversation_index >= conversations_num - 1:
-        st.session_state.review_conversation_index -= 1
-    st_logger.info(f"Conversation {rec_id} review set to 'good'")
-
+    """
+    st.session_state.review_conversations_buffer.pop(st.session_state.review_conversation_index)
@@ -0,0 +1,54 @@
+import gettext
+
+from functools import lru_cache, partial
+from typing import Callable
+
+
+@lru_cache(maxsize=8)
+def load_translation(language: str) -> gettext.NullTranslations:
+    """
+    Loads translations of given language from predefined locales.
+    Translations object is created only once per language, so .mo files are not read on every language change.
+
+    Args:
+        language (str): Language code (e.g. 'sk', 'en')
+
+    Returns:
+        gettext.NullTranslations: Translations object of the language
+
+    Raises:
+        FileNotFoundError: If no translation file is found for the language
+    """
+    return gettext.translation('base', localedir='locales', languages=[language])
+
+
+@lru_cache(maxsize=512)
+def translate(language: str, message: str) -> str:
+    """
+    Translates message to given language based on predefined locales.
+    Translations are cached, so each message is looked up only once per language.
+
+    Args:
+        language (str): Language code (e.g. 'sk', 'en')
+        message (str): Message to be translated
+
+    Returns:
+        str: Translated message
+    """
+    return load_translation(language).gettext(message)
+
+
+@lru_cache(maxsize=8)
+def get_translator(language: str) -> Callable[[str], str]:
+    """
+    Returns translator function of given language, which is stored in session state.
+    Translated messages are cached (see 'translate'), so every message is looked up only once per language.
+
+    Args:
+        language (str): Language code (e.g. 'sk', 'en')
+
+    Returns:
+        Callable[[str], str]: Function translating message to the language
+    """
+    return partial(translate, language)
+
@@ -1,45 +1,99 @@
+import asyncio
 import datetime
 import streamlit as st
 
+from functools import lru_cache
 from common.logging.st_logger import st_logger
+from src.session.translations import get_translator
 
-# Stores attributes given in 'record_keys' from 'record' to 'data' dictionaries 
-def load_header_attributes(data, record, data_keys, record_keys):
-    for data_key, record_key in zip(data_keys, record_keys):
-        try:
-            data[data_key].append(record['header'][record_key])
-        except Exception as e:
-            st_logger.debug(e)
-            data[data_key].append(None)
+# Returns values of attributes given in 'record_keys' from 'record' (missing attributes are None)
+# Attributes of 'knowledge' and 'history' records (except ID) are stored in the record header
+def flatten_record(record, collection, record_keys):
+    if collection == 'webscraper':
+        return [record.get(record_key) for record_key in record_keys]
+    header = record.get('header') or {}
+    return [record.get('_id')] + [header.get(record_key) for record_key in record_keys[1:]]
 
 
-# Stores attributes given in 'record_keys' from 'record' to 'data' dictionaries 
-def load_attributes(data, record, data_keys, record_keys):
-    for data_key, record_key in zip(data_keys, record_keys):
-        try:
-            data[data_key].append(record[record_key])
-        except Exception as e:
-            st_logger.debug(e)
-            data[data_key].append(None)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns event loop of the current session. The loop is created only once
+    and stored in the session state, so it is reused by all endpoint calls.
+
+    Args:
+        None
+
+    Returns:
+        asyncio.AbstractEventLoop: Event loop of the current session
+    """
+    if "event_loop" not in st.session_state or st.session_state.event_loop.is_closed():
+        st.session_state.event_loop = asyncio.new_event_loop()
+    return st.session_state.event_loop
+
+
+def run_async(coroutine: object) -> object:
+    """
+    Runs coroutine in the event loop of the current session.
+    Replacement for asyncio.run, which creates and closes new event loop on every call.
+
+    Args:
+        coroutine (object): Coroutine to be run
+
+    Returns:
+        object: Result of the coroutine
+    """
+    return get_event_loop().run_until_complete(coroutine)
+
+
+def run_async_concurrently(*coroutines: object, return_exceptions: bool = False) -> list:
+    """
+    Runs coroutines concurrently (asyncio.gather) in the event loop of the current session.
+
+    Args:
+        *coroutines (object): Coroutines to be run
+        return_exceptions (bool): If True, exceptions are returned as results instead of being raised,
+            so one failing coroutine does not hide results of the others
+
+    Returns:
+        list: Results of the coroutines in the same order as provided
+    """
+    async def gather_all():
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    return run_async(gather_all())
+
+
+async def gather_bounded(coroutines: list, limit: int = 16, return_exceptions: bool = False) -> list:
+    """
+    Runs coroutines concurrently (asyncio.gather), but at most 'limit' of them at the same time.
+
+    Args:
+        coroutines (list): Coroutines to be run
+        limit (int): Maximal number of concurrently running coroutines. Default is 16
+        return_exceptions (bool): If True, exceptions are returned as results instead of being raised
+
+    Returns:
+        list: Results of the coroutines in the same order as provided
+    """
+    semaphore = asyncio.Semaphore(limit)
 
+    async def run_bounded(coroutine):
+        async with semaphore:
+            return await coroutine
 
-# Returns dict with keys provided as argument paired with empty lists
-def build_empty_dict(keys):
-    data = {}
-    for dict_key in keys:
-        data[dict_key] = []
-    return data
+    return await asyncio.gather(*(run_bounded(coroutine) for coroutine in coroutines), return_exceptions=return_exceptions)
 
 
 # Returns standardized file record based on template to be stored in MongoDB
-def create_file_record(file):
+# If 'content_ref' (ID of file content stored in GridFS) is given, content itself is not read
+def create_file_record(file, content_ref=None, md5sum=None):
     now = datetime.datetime.now()
     date_time = now.strftime("%d-%m-%Y_%H-%M-%S")
     try:
-        file_data = file.read()
         file_size = file.size
         file_name = file.name
         file_type = file.type
+        file_data = file.read() if content_ref is None else None
     except Exception as e:
         st_logger.error(e)
         st.toast("Error: cannot read uploaded file")
@@ -52,11 +106,14 @@ def create_file_record(file):
             "author" : "admin",
             "size" : file_size,
             "ingested" : False,
-            "md5sum" : None,
+            "md5sum" : md5sum,
             "type" : file_type
-        },
-        "content": file_data
+        }
     }
+    if content_ref is None:
+        record["content"] = file_data
+    else:
+        record["content_ref"] = content_ref
     return record
 
 
@@ -71,7 +128,8 @@ def get_rec_id(df: object, selected_row_index: int) -> str:
     Returns:
         str: Record ID
     """
-    return df.iloc[selected_row_index]['ID']
+    # Scalar access by position, row is not materialized as Series
+    return df.iat[selected_row_index, df.columns.get_loc('ID')]
 
 
 def get_rec_descriptor(collection: str, df: object, selected_row_index: int) -> str:
@@ -87,15 +145,70 @@ def get_rec_descriptor(collection: str, df: object, selected_row_index: int) ->
     Returns:
         str: Record descriptor (filename, description, URL, etc.)
     """
-    match collection:
-        case 'knowledge':
-            return df.iloc[selected_row_index][st.session_state.translator('Name')]
-        case 'history':
-            return df.iloc[selected_row_index][st.session_state.translator('Description')]
-        case 'webscraper':
-            return df.iloc[selected_row_index]['URL']
-        case _:
-            return df.iloc[selected_row_index]['ID']
+    return df.iat[selected_row_index, df.columns.get_loc(get_rec_descriptor_column(collection))]
+
+
+# Columns with record descriptors of each collection (column name, translated flag)
+DESCRIPTOR_COLUMNS = {
+    'knowledge': ('Name', True),
+    'history': ('Description', True),
+    'webscraper': ('URL', False),
+}
+
+
+def get_rec_descriptor_column(collection: str) -> str:
+    """
+    Get name of DataFrame column with record descriptors based on collection type.
+
+    Args:
+        collection (str): Name of collection in MongoDB
+
+    Returns:
+        str: Name of column with record descriptors
+    """
+    column, translated = DESCRIPTOR_COLUMNS.get(collection, ('ID', False))
+    return st.session_state.translator(column) if translated else column
+
+
+# Keys of record attributes displayed as columns of dataset of each collection (see 'get_columns')
+RECORD_KEYS = {
+    'knowledge': [
+        '_id', 
+        'file_name', 
+        'date_time', 
+        'author', 
+        'size', 
+        'ingested', 
+        'md5sum', 
+        'type'
+    ],
+    'history': [
+        '_id', 
+        'title', 
+        'user_id', 
+        'feedback', 
+        'review',
+        'reviewed_by',
+        'ingested', 
+        'discord', 
+        'date_time'
+    ],
+    'webscraper': [
+        '_id', 
+        'description', 
+        'url', 
+        'owner', 
+        'date'
+    ],
+}
+
+# Names of columns of dataset of each collection, names without translation are not translated
+COLUMNS = {
+    'knowledge': ['ID', 'Name', 'Date', 'Author', 'Size', 'Ingested', 'MD5Sum', 'Type'],
+    'history': ['ID', 'Description', 'User', 'Feedback', 'Review', 'Reviewed by', 'Ingested', 'Discord', 'Date'],
+    'webscraper': ['ID', 'Web description', 'URL', 'Author', 'Date'],
+}
+UNTRANSLATED_COLUMNS = {'ID', 'MD5Sum', 'Discord', 'URL'}
 
 
 def get_columns(collection: str) -> list:
@@ -109,42 +222,30 @@ def get_columns(collection: str) -> list:
     Returns:
         list: List of columns for dataset
     """
-    
-    if collection == 'knowledge':
-        columns = [
-            'ID',
-            st.session_state.translator('Name'),
-            st.session_state.translator('Date'),
-            st.session_state.translator('Author'),
-            st.session_state.translator('Size'),
-            st.session_state.translator('Ingested'),
-            'MD5Sum',
-            st.session_state.translator('Type')
-        ]
-    elif collection == 'history':
-        columns = [
-            'ID', 
-            st.session_state.translator('Description'),  
-            st.session_state.translator('User'), 
-            st.session_state.translator('Feedback'),
-            st.session_state.translator('Review'),
-            st.session_state.translator('Reviewed by'),
-            st.session_state.translator('Ingested'),
-            'Discord',
-            st.session_state.translator('Date'),
-        ]
-    elif collection == 'webscraper':
-        columns = [
-            'ID',
-            st.session_state.translator('Web description'),
-            'URL',
-            st.session_state.translator('Author'),
-            st.session_state.translator('Date'),
-        ]
-    else:
-        columns = None
+    columns = get_translated_columns(collection, st.session_state.session_lang)
+    return list(columns) if columns is not None else None
+
+
+@lru_cache(maxsize=32)
+def get_translated_columns(collection: str, language: str) -> tuple:
+    """
+    Translate names of columns of dataset of the collection. Result is cached
+    per collection and language, so names are translated only once.
+
+    Args:
+        collection (str): Name of collection in MongoDB
+        language (str): Language code (e.g. 'sk', 'en')
 
-    return columns
+    Returns:
+        tuple: Translated names of columns, None for unknown collection
+    """
+    if collection not in COLUMNS:
+        return None
+    translator = get_translator(language)
+    return tuple(
+        column if column in UNTRANSLATED_COLUMNS else translator(column)
+        for column in COLUMNS[collection]
+    )
 
 
 def get_record_keys(collection: str) -> list:
@@ -158,39 +259,4 @@ def get_record_keys(collection: str) -> list:
     Returns:
         list: List of keys for record
     """
-
-    if collection == 'knowledge':
-        record_keys = [
-            '_id', 
-            'file_name', 
-            'date_time', 
-            'author', 
-            'size', 
-            'ingested', 
-            'md5sum', 
-            'type'
-        ]
-    elif collection == 'history':
-        record_keys = [
-            '_id', 
-            'title', 
-            'user_id', 
-            'feedback', 
-            'review',
-            'reviewed_by',
-            'ingested', 
-            'discord', 
-            'date_time'
-        ]
-    elif collection == 'webscraper':
-        record_keys = [
-            '_id', 
-            'description', 
-            'url', 
-            'owner', 
-            'date'
-        ]
-    else:
-        record_keys = None
-
-    return record_keys
\ No newline at end of file
+    return RECORD_KEYS.get(collection)
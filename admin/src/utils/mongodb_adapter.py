@@ -1,10 +1,69 @@
+import hashlib
 import pymongo
 import pandas as pd
+import streamlit as st
 
 import src.utils.helpers as helpers
 from common.logging.st_logger import st_logger
 from common.session.db_connection import mongo_db
 
+# Fields loaded from MongoDB when dataset of the collection is created (only displayed columns, see 'helpers.get_record_keys')
+# Large fields (file content, conversation content, scraped content) are loaded only by 'load_record'
+PROJECTIONS = {
+    "knowledge": {"header." + key: 1 for key in helpers.get_record_keys("knowledge")[1:]},
+    "history": {"header." + key: 1 for key in helpers.get_record_keys("history")[1:]},
+    "webscraper": {key: 1 for key in helpers.get_record_keys("webscraper")[1:]},
+}
+
+# Fields of conversation used by conversations review (content is loaded only for displayed conversation)
+CONVERSATION_REVIEW_PROJECTION = {"header.review": 1}
+
+# Indexes used by queries of the admin app (collection -> indexed fields)
+INDEXES = {
+    "history": ["header.review"],
+}
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_indexes() -> None:
+    """
+    Function that creates indexes used by queries of the admin app (e.g. conversations for review).
+    Called at app start, cached, so it runs only once per process. Existing indexes are left untouched.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for collection, fields in INDEXES.items():
+        mongo_db.set_collection(collection)
+        for field in fields:
+            try:
+                mongo_db.collection.create_index(field)
+            except pymongo.errors.PyMongoError as e:
+                st_logger.error(f"Error during creating of index '{field}' in '{collection}': {e}")
+
+
+# Version of data of each collection, it is part of cache key of 'load_dataset'.
+# Bumped after every modification of the collection, so only its cached datasets become stale.
+DATASET_VERSIONS = {"knowledge": 0, "history": 0, "webscraper": 0}
+
+
+def invalidate_dataset(collection: str) -> None:
+    """
+    Function that marks cached datasets of the collection as outdated (see 'load_dataset').
+    Called after every modification of the collection.
+
+    Args:
+        collection (str): Name of the modified collection
+
+    Returns:
+        None
+    """
+    DATASET_VERSIONS[collection] = DATASET_VERSIONS.get(collection, 0) + 1
+
+
 # Function that delete a record with ObjectID 'rec_id' from MongoDB history collection
 def delete_record(rec_id: str, collection: str) -> pymongo.results.DeleteResult:
     """
@@ -18,27 +77,94 @@ def delete_record(rec_id: str, collection: str) -> pymongo.results.DeleteResult:
         DeleteResult object: Result of the deletion operation
     """
 
+    delete_file_contents([rec_id], collection)
     mongo_db.set_collection(collection)
     filter = {"_id":rec_id}
-    return mongo_db.collection.delete_one(filter)
+    result = mongo_db.collection.delete_one(filter)
+    invalidate_dataset(collection)
+    return result
+
+
+def delete_file_contents(rec_ids: list, collection: str) -> None:
+    """
+    Function that deletes file contents stored in GridFS by records with ObjectIDs 'rec_ids'
+
+    Args:
+        rec_ids (list): ObjectIDs of the records referencing the contents
+        collection (str): Name of the collection where the records are stored
+
+    Returns:
+        None
+    """
+
+    mongo_db.set_collection(collection)
+    records = mongo_db.collection.find({"_id": {"$in": rec_ids}, "content_ref": {"$exists": True}}, projection={"content_ref": 1})
+    for record in records:
+        mongo_db.delete_file(record["content_ref"])
+
+
+def delete_unstored_file_contents(records: list, collection: str) -> None:
+    """
+    Function that deletes file contents stored in GridFS by records which were not stored in MongoDB
+    collection (e.g. after failed insertion), so their contents are not left orphaned.
+
+    Args:
+        records (list): Records referencing the contents (see 'create_stored_file_record')
+        collection (str): Name of the collection where the records should have been stored
+
+    Returns:
+        None
+    """
+
+    mongo_db.set_collection(collection)
+    # IDs are assigned to records by the driver before insertion, so partially inserted batch can be recognized
+    rec_ids = [record["_id"] for record in records if "_id" in record]
+    stored_ids = {record["_id"] for record in mongo_db.collection.find({"_id": {"$in": rec_ids}}, projection={"_id": 1})}
+    for record in records:
+        if record.get("_id") not in stored_ids:
+            mongo_db.delete_file(record["content_ref"])
+
+
+def delete_many_records(rec_ids: list, collection: str) -> pymongo.results.BulkWriteResult:
+    """
+    Function that deletes records with ObjectIDs 'rec_ids' from MongoDB collection by one bulk request
+
+    Args:
+        rec_ids (list): ObjectIDs of the records to be deleted
+        collection (str): Name of the collection where the records are stored
+
+    Returns:
+        BulkWriteResult object: Result of the deletion operation, None if there is nothing to delete
+    """
+
+    if not rec_ids:
+        return None
+    delete_file_contents(rec_ids, collection)
+    mongo_db.set_collection(collection)
+    requests = [pymongo.DeleteOne({"_id": rec_id}) for rec_id in rec_ids]
+    result = mongo_db.collection.bulk_write(requests, ordered=False)
+    invalidate_dataset(collection)
+    return result
 
 
 #Function that returns one record from Mongo based on rec_id
-def load_record(rec_id: str, collection: str) -> dict:
+def load_record(rec_id: str, collection: str, fields: list = None) -> dict:
     """
     Function that returns one record from MongoDB based on rec_id
 
     Args:
         rec_id (str): ObjectID of the record to be returned
         collection (str): Name of the collection where the record is stored
+        fields (list): Fields of the record to be returned (e.g. 'header.ingested'). Default is None (whole record)
 
     Returns:
         dict: Dictionary containing the record data
     """
     
     mongo_db.set_collection(collection)
+    projection = {field: 1 for field in fields} if fields else None
     try:
-        history_data = mongo_db.collection.find_one({"_id":rec_id})
+        history_data = mongo_db.collection.find_one({"_id":rec_id}, projection=projection)
         if history_data is None:
             raise Exception
         return history_data
@@ -66,7 +192,88 @@ def update_record_element(rec_id: str, element_key: str, new_value: any, collect
     key = 'header.' + element_key
     filter = {"_id":rec_id}
     update = {'$set': {key: new_value}}
-    return mongo_db.collection.update_one(filter,update)
+    result = mongo_db.collection.update_one(filter,update)
+    invalidate_dataset(collection)
+    return result
+
+
+#Function that updates values of multiple header elements by one request
+def update_record_elements(rec_id: str, updates: dict, collection: str) -> pymongo.results.UpdateResult:
+    """
+    Function that updates values of multiple header elements of a record in MongoDB collection by one request
+
+    Args:
+        rec_id (str): ObjectID of the record to be updated
+        updates (dict): Keys of the elements to be updated paired with their new values
+        collection (str): Name of the collection where the record is stored
+
+    Returns:
+        UpdateResult object: Result of the update operation
+    """
+    
+    mongo_db.set_collection(collection)
+    filter = {"_id":rec_id}
+    update = {'$set': {'header.' + element_key: new_value for element_key, new_value in updates.items()}}
+    result = mongo_db.collection.update_one(filter,update)
+    invalidate_dataset(collection)
+    return result
+
+
+#Function that updates value in header element of multiple records by one request
+def update_many_records_element(rec_ids: list, element_key: str, new_value: any, collection: str) -> pymongo.results.BulkWriteResult:
+    """
+    Function that updates value in header element of records with ObjectIDs 'rec_ids' in MongoDB collection by one bulk request
+
+    Args:
+        rec_ids (list): ObjectIDs of the records to be updated
+        element_key (str): Key of the element to be updated
+        new_value (any): New value to be set
+        collection (str): Name of the collection where the records are stored
+
+    Returns:
+        BulkWriteResult object: Result of the update operation, None if there is nothing to update
+    """
+
+    if not rec_ids:
+        return None
+    mongo_db.set_collection(collection)
+    update = {'$set': {'header.' + element_key: new_value}}
+    requests = [pymongo.UpdateOne({"_id": rec_id}, update) for rec_id in rec_ids]
+    result = mongo_db.collection.bulk_write(requests, ordered=False)
+    invalidate_dataset(collection)
+    return result
+
+
+# Size of chunks in which uploaded files are read and stored in GridFS
+FILE_CHUNK_SIZE = 1 << 20
+
+
+# Stores content of uploaded file in GridFS and returns record referencing it
+def create_stored_file_record(file: object) -> dict:
+    """
+    Function that stores content of the uploaded file in GridFS (read and sent in chunks)
+    and creates a record referencing the content, so the record itself stays small.
+    MD5 checksum of the content is computed from the same chunks.
+
+    Args:   
+        file (object): File object that was uploaded
+
+    Returns:
+        dict: Record of the file to be stored in MongoDB
+    """
+
+    md5 = hashlib.md5()
+    grid_in = mongo_db.new_file(filename=file.name, contentType=file.type)
+    try:
+        while chunk := file.read(FILE_CHUNK_SIZE):
+            grid_in.write(chunk)
+            md5.update(chunk)
+    except BaseException:
+        # Chunks already sent to GridFS are deleted, so failed upload leaves no orphaned chunks
+        grid_in.abort()
+        raise
+    grid_in.close()
+    return helpers.create_file_record(file, grid_in._id, md5.hexdigest())
 
 
 # Handles event of file upload on Admin FE
@@ -82,25 +289,75 @@ def upload_file(file: object, collection: str) -> pymongo.results.InsertOneResul
         InsertOneResult object: Result of the insertion operation
     """
     
-    mongo_db.set_collection(collection)
-    record = helpers.create_file_record(file)
     # Send record to MongoDB
     try:
-        return mongo_db.collection.insert_one(record)
+        record = create_stored_file_record(file)
+        mongo_db.set_collection(collection)
+        result = mongo_db.collection.insert_one(record)
+        invalidate_dataset(collection)
+        return result
     except ConnectionError as e:
         st_logger.error("Error during file upload to MongoDB: " + str(e))
         return None
 
 
-def create_conversations_buffer() -> pymongo.cursor:
+# Stores already created file records in MongoDB
+def insert_records(records: list, collection: str) -> pymongo.results.InsertManyResult:
+    """
+    Function that stores records in MongoDB collection by one request.
+
+    Args:   
+        records (list): Records to be stored
+        collection (str): Name of the collection where the records should be stored
+
+    Returns:
+        InsertManyResult object: Result of the insertion operation, None if there is nothing to insert
+    """
+    
+    if not records:
+        return None
+    mongo_db.set_collection(collection)
+    # Send records to MongoDB
+    try:
+        result = mongo_db.collection.insert_many(records, ordered=False)
+        invalidate_dataset(collection)
+        return result
+    except ConnectionError as e:
+        st_logger.error("Error during file upload to MongoDB: " + str(e))
+        return None
+
+
+# Handles event of upload of multiple files on Admin FE
+def upload_files(files: list, collection: str) -> pymongo.results.InsertManyResult:
+    """
+    Function that creates records based on the uploaded files and stores them in MongoDB by one request.
+
+    Args:   
+        files (list): File objects that were uploaded
+        collection (str): Name of the collection where the records should be stored
+
+    Returns:
+        InsertManyResult object: Result of the insertion operation, None if there is nothing to upload
+    """
+    
+    try:
+        records = [create_stored_file_record(file) for file in files]
+    except ConnectionError as e:
+        st_logger.error("Error during file upload to MongoDB: " + str(e))
+        return None
+    return insert_records(records, collection)
+
+
+def create_conversations_buffer() -> list:
     """
     Function that creates a buffer of conversations that have not been reviewed yet.
+    Only IDs of the conversations are loaded, content is loaded by 'load_record' when displayed.
 
     Args:   
         None
 
     Returns:
-        conversations_buffer (pymongo.cursor): Cursor object containing the conversations from Mongo that have not been reviewed yet
+        conversations_buffer (list): List of conversations (IDs) from Mongo that have not been reviewed yet
 
     """
 
@@ -108,7 +365,8 @@ def create_conversations_buffer() -> pymongo.cursor:
     filter = {"header.review": None}
 
     try:
-        conversations_buffer = mongo_db.collection.find(filter)
+        # Conversations are loaded at once, so they can be indexed without querying MongoDB again
+        conversations_buffer = list(mongo_db.collection.find(filter, projection=CONVERSATION_REVIEW_PROJECTION))
     except ConnectionError as e:
         st_logger.error("Error during conversations load from MongoDB: " + str(e))
         conversations_buffer = []
@@ -116,13 +374,16 @@ def create_conversations_buffer() -> pymongo.cursor:
     return conversations_buffer
 
 
-def create_dataset_from_mongodb(collection: str, query: dict = None) -> pd.DataFrame:
+def create_dataset_from_mongodb(collection: str, query: dict = None, batch_size: int = 0, page: int = 0, page_size: int = 0) -> pd.DataFrame:
     """
     Function that creates a dataset from MongoDB based on the collection and query provided.
 
     Args:   
         collection (str): Name of the collection where the records are stored
         query (dict): Dictionary containing the query to be executed
+        batch_size (int): Number of records returned by MongoDB in one batch. Default is 0 (driver default)
+        page (int): Index of the page of records to be loaded (starting from 0). Default is 0
+        page_size (int): Number of records on one page. Default is 0 (all records)
 
     Returns:
         pd.DataFrame: DataFrame containing the records from MongoDB
@@ -130,7 +391,14 @@ def create_dataset_from_mongodb(collection: str, query: dict = None) -> pd.DataF
 
     mongo_db.set_collection(collection)
     try:
-        records_buffer = mongo_db.collection.find(query)
+        records_buffer = (
+            mongo_db.collection.find(query, projection=PROJECTIONS.get(collection))
+            # Stable order of records, so pages neither overlap nor skip records (newest first)
+            .sort("_id", -1)
+            .skip(page * page_size)
+            .limit(page_size)
+            .batch_size(batch_size)
+        )
     except Exception as e:
         st_logger.error(e)
         records_buffer = None
@@ -138,15 +406,121 @@ def create_dataset_from_mongodb(collection: str, query: dict = None) -> pd.DataF
     columns = helpers.get_columns(collection)
     record_keys = helpers.get_record_keys(collection)
 
-    # Dataset to build the DF from
-    data = helpers.build_empty_dict(columns)
+    # Build the DF from flat rows of needed parameters based on 'record_keys' (individual stored files)
+    df = pd.DataFrame.from_records(
+        (helpers.flatten_record(record, collection, record_keys) for record in records_buffer or []),
+        columns=columns,
+    )
+    # Displayed columns are stored in Arrow arrays, so they are passed to st.dataframe without conversion
+    # IDs (ObjectId) are kept as Python objects, they are only used by actions and never displayed
+    displayed_columns = columns[1:]
+    df[displayed_columns] = df[displayed_columns].convert_dtypes(dtype_backend="pyarrow")
+    return df
 
-    # Loop over buffer elements (individual stored files) and store needed parameters based on 'record_keys'
-    for record in records_buffer:
-        if collection == 'webscraper':
-            helpers.load_attributes(data, record, columns, record_keys)
-        else:
-            data['ID'].append(record['_id'])
-            helpers.load_header_attributes(data, record, columns[1:], record_keys[1:])
-    
-    return pd.DataFrame(data)
\ No newline at end of file
+
+def count_records(collection: str, query: dict = None) -> int:
+    """
+    Function that returns number of records in MongoDB collection matching the query.
+
+    Args:   
+        collection (str): Name of the collection where the records are stored
+        query (dict): Dictionary containing the query to be executed
+
+    Returns:
+        int: Number of records
+    """
+
+    mongo_db.set_collection(collection)
+    if not query:
+        # Metadata based count, collection is not scanned
+        return mongo_db.collection.estimated_document_count()
+    return mongo_db.collection.count_documents(query)
+
+
+# Number of records displayed on one page of the table
+DATASET_PAGE_SIZE = 500
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_dataset(collection: str, query: dict = None, batch_size: int = 0, language: str = None, version: int = 0, page: int = 0) -> pd.DataFrame:
+    """
+    Cached version of 'create_dataset_from_mongodb'. The cache is shared across all sessions,
+    so the dataset is not loaded from MongoDB on every page visit. Language is part of the
+    cache key, because names of the columns are translated.
+
+    Args:
+        collection (str): Name of the collection where the records are stored
+        query (dict): Dictionary containing the query to be executed
+        batch_size (int): Number of records returned by MongoDB in one batch. Default is 0 (whole page in one batch)
+        language (str): Language of the column names
+        version (int): Version of data of the collection (see 'DATASET_VERSIONS')
+        page (int): Index of the page of records (see 'DATASET_PAGE_SIZE'). Default is 0
+
+    Returns:
+        pd.DataFrame: DataFrame containing the records from MongoDB
+    """
+    # Whole page is fetched in one batch, without additional round trips to MongoDB
+    return create_dataset_from_mongodb(collection, query, batch_size or DATASET_PAGE_SIZE, page, DATASET_PAGE_SIZE)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_records_count(collection: str, query: dict = None, version: int = 0) -> int:
+    """
+    Cached version of 'count_records'.
+
+    Args:
+        collection (str): Name of the collection where the records are stored
+        query (dict): Dictionary containing the query to be executed
+        version (int): Version of data of the collection (see 'DATASET_VERSIONS')
+
+    Returns:
+        int: Number of records
+    """
+    return count_records(collection, query)
+
+
+def get_dataset(collection: str, query: dict = None, batch_size: int = 0, page: int = 0) -> pd.DataFrame:
+    """
+    Returns page of dataset of the collection for language of the current session.
+    Dataset is loaded from MongoDB only when its cached version is outdated.
+
+    Args:
+        collection (str): Name of the collection where the records are stored
+        query (dict): Dictionary containing the query to be executed
+        batch_size (int): Number of records returned by MongoDB in one batch. Default is 0 (whole page in one batch)
+        page (int): Index of the page of records (see 'DATASET_PAGE_SIZE'). Default is 0
+
+    Returns:
+        pd.DataFrame: DataFrame containing the records from MongoDB
+    """
+    return load_dataset(collection, query, batch_size, st.session_state.session_lang, DATASET_VERSIONS.get(collection, 0), page)
+
+
+def get_pages_count(collection: str, query: dict = None) -> int:
+    """
+    Returns number of pages of dataset of the collection.
+
+    Args:
+        collection (str): Name of the collection where the records are stored
+        query (dict): Dictionary containing the query to be executed
+
+    Returns:
+        int: Number of pages (at least 1)
+    """
+    records_count = load_records_count(collection, query, DATASET_VERSIONS.get(collection, 0))
+    return max(1, -(-records_count // DATASET_PAGE_SIZE))
+
+
+def reload_dataset(collection: str) -> None:
+    """
+    Invalidates cached datasets of the collection and loads fresh dataset to the session state.
+    Has to be called after modifications of the collection made outside of this module (e.g. via API).
+
+    Args:
+        collection (str): Name of the collection where the records are stored
+
+    Returns:
+        None
+    """
+    invalidate_dataset(collection)
+    st.session_state['dataset_' + collection] = get_dataset(collection, page=st.session_state.get('page_' + collection, 1) - 1)
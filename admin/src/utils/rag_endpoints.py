@@ -1,6 +1,6 @@
 import os
 import streamlit as st
-from httpx import BasicAuth, AsyncClient, Timeout, HTTPError, ReadTimeout, Response, ConnectTimeout
+from httpx import BasicAuth, AsyncClient, Limits, Timeout, HTTPError, ReadTimeout, Response, ConnectTimeout
 from common.session.decorators import http_timer
 from common.logging.st_logger import st_logger
 
@@ -12,10 +12,33 @@ BASE_URL = "http://backend:8080"
 USERNAME = "admin"
 PASSWORD = os.getenv("GUI_PASSWORD")
 
+# Maximal number of idle connections kept open by shared HTTP client
+MAX_KEEPALIVE_CONNECTIONS = 32
+# Maximal number of all connections of shared HTTP client (bounds concurrent selection actions)
+MAX_CONNECTIONS = 50
+
+
+def get_http_client() -> AsyncClient:
+    """
+    Returns HTTP client of the current session. The client is created only once
+    and stored in the session state, so its connection pool is reused by all
+    endpoint calls (run in the session event loop, see helpers.run_async).
+
+    Args:
+        None
+
+    Returns:
+        httpx.AsyncClient: Shared HTTP client
+    """
+    if "http_client" not in st.session_state or st.session_state.http_client.is_closed:
+        st.session_state.http_client = AsyncClient(limits=Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS, max_connections=MAX_CONNECTIONS))
+    return st.session_state.http_client
+
 
 # Function that converts st.file_uploader UploadedFile instance to fastAPI UploadFile instance
-def convert_file_to_UploadFile(file_data, file_name, file_type):
-    file = {"file": (file_name, file_data, file_type)}
+# File-like handles (UploadedFile, GridOut) are not read here, httpx streams them in chunks
+def convert_file_to_UploadFile(file_handle, file_name, file_type):
+    file = {"file": (file_name, file_handle, file_type)}
     return file
 
 
@@ -39,8 +62,8 @@ async def get_status():
     # Basic authentication credentials
     auth = BasicAuth(USERNAME, PASSWORD)
 
-    async with AsyncClient(auth=auth) as client:
-        response = await client.get(BASE_URL + "/api/status")
+    client = get_http_client()
+    response = await client.get(BASE_URL + "/api/status", auth=auth)
 
     return response
 
@@ -49,25 +72,26 @@ async def get_status():
 @http_timer
 async def post_ingest_file(file):
 
+    file_name = file["file"][0]
     try:
-        async with AsyncClient(timeout=Timeout(300.0, connect=10.0)) as client:
-            response = await client.post(BASE_URL+"/api/ingest_file", files=file)
+        client = get_http_client()
+        response = await client.post(BASE_URL+"/api/ingest_file", files=file, timeout=Timeout(300.0, connect=10.0))
         return response
     except ReadTimeout:
-        st_logger.error("Read timeout occurred when ingesting file: " + file.name)
-        st.toast(st.session_state.translator("⚠️Read timeout occurred. Failed to learn: ") + file.name)
+        st_logger.error("Read timeout occurred when ingesting file: " + file_name)
+        st.toast(st.session_state.translator("⚠️Read timeout occurred. Failed to learn: ") + file_name)
         return Response(status_code=504)
     except ConnectTimeout:
-        st_logger.error("Connection timeout occurred when ingesting file: " + file.name)
-        st.toast(st.session_state.translator("⚠️Connection timeout occurred. Failed to learn: ") + file.name)
+        st_logger.error("Connection timeout occurred when ingesting file: " + file_name)
+        st.toast(st.session_state.translator("⚠️Connection timeout occurred. Failed to learn: ") + file_name)
         return Response(status_code=504)
     except HTTPError as e:
-        st_logger.error(f"HTTP error occurred when ingesting file: {file.name}: {e}")
-        st.toast(st.session_state.translator("⚠️HTTP error occurred. Failed to learn: ") + file.name)
+        st_logger.error(f"HTTP error occurred when ingesting file: {file_name}: {e}")
+        st.toast(st.session_state.translator("⚠️HTTP error occurred. Failed to learn: ") + file_name)
         return Response(status_code=500)
     except Exception as e:
-        st_logger.error(f"An error occurred when ingesting file: {file.name}: {e}")
-        st.toast(st.session_state.translator("⚠️Something went wrong. Failed to learn: ") + file.name)
+        st_logger.error(f"An error occurred when ingesting file: {file_name}: {e}")
+        st.toast(st.session_state.translator("⚠️Something went wrong. Failed to learn: ") + file_name)
         return Response(status_code=500)
 
 
@@ -77,21 +101,21 @@ async def post_ingest_text(text, content_type="text/plain"):
 
     headers = {"Content-Type": content_type}
 
-    async with AsyncClient() as client:
-        if content_type == "application/json":
-            # If the content type is JSON, send the text in JSON format
-            response = await client.post(
-                f"{BASE_URL}/api/ingest_text",
-                headers=headers,
-                json={"text": text}
-            )
-        else:
-            # For other content types like plain text
-            response = await client.post(
-                f"{BASE_URL}/api/ingest_text",
-                headers=headers,
-                content=text
-            )
+    client = get_http_client()
+    if content_type == "application/json":
+        # If the content type is JSON, send the text in JSON format
+        response = await client.post(
+            f"{BASE_URL}/api/ingest_text",
+            headers=headers,
+            json={"text": text}
+        )
+    else:
+        # For other content types like plain text
+        response = await client.post(
+            f"{BASE_URL}/api/ingest_text",
+            headers=headers,
+            content=text
+        )
 
     return response
 
@@ -112,8 +136,8 @@ async def get_retrieve_data(text, filename=None, user=None, date=None, n_results
     # Filter out parameters with None values
     params = {k: v for k, v in params.items() if v is not None}
 
-    async with AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/api/retrieve_data", params=params)
+    client = get_http_client()
+    response = await client.get(f"{BASE_URL}/api/retrieve_data", params=params)
 
     return response
 
@@ -131,8 +155,8 @@ async def delete_delete_data(file_name, user=None, date=None):
 
     # Filter out parameters with None values
     params = {k: v for k, v in params.items() if v is not None}
-    async with AsyncClient() as client:
-        response = await client.delete(f"{BASE_URL}/api/delete_data", params=params)
+    client = get_http_client()
+    response = await client.delete(f"{BASE_URL}/api/delete_data", params=params)
 
     return response
 
@@ -157,19 +181,19 @@ async def post_webscraper(url: str, description: str, owner: str) -> dict:
         "description": description,
         "owner": owner
     }
-    async with AsyncClient(timeout=Timeout(60.0, connect=10.0)) as client:
-        response = await client.post(f"{BASE_URL}/api/webscraper/webscraper", json=body)
+    client = get_http_client()
+    response = await client.post(f"{BASE_URL}/api/webscraper/webscraper", json=body, timeout=Timeout(60.0, connect=10.0))
     return response
 
 
 @http_timer
-async def delete_delete_one_mongo_record(collection_name: str, _id: str) -> dict:
+async def delete_delete_one_chroma_record(collection_name: str, filter: dict) -> dict:
     """
     Function that deletes one record from the MongoDB
 
     Args:
         collection_name (str): Name of the collection to delete from
-        filter (dict):Filter of the record to delete
+        filter (dict): Filter to find the record to delete
 
     Returns:
         dict: Response from the endpoint
@@ -178,38 +202,32 @@ async def delete_delete_one_mongo_record(collection_name: str, _id: str) -> dict
 
     body = {
         "collection_name": collection_name,
-        "filter": {"_id": _id}
+        "filter": filter
     }
-    async with AsyncClient() as client:
-        response = await client.request('DELETE', f"{BASE_URL}/api/common/delete_one_mongo_record", json=body)
+    client = get_http_client()
+    response = await client.request('DELETE', f"{BASE_URL}/api/common/delete_one_chroma_record", json=body)
     return response
 
 
 @http_timer
-async def delete_delete_one_chroma_record(collection_name: str, filter: dict) -> dict:
+async def post_faq_load_records(records: list) -> dict:
     """
-    Function that deletes one record from the MongoDB
+    Async function that sends a POST request to create new FAQ records by one request.
 
     Args:
-        collection_name (str): Name of the collection to delete from
-        filter (dict): Filter to find the record to delete
+        records (list): FAQ records, dictionaries with 'question', 'answer' and optional 'doc' and 'url' keys
 
     Returns:
         dict: Response from the endpoint
 
     """
 
-    body = {
-        "collection_name": collection_name,
-        "filter": filter
-    }
-    async with AsyncClient() as client:
-        response = await client.request('DELETE', f"{BASE_URL}/api/common/delete_one_chroma_record", json=body)
+    client = get_http_client()
+    response = await client.post(f"{BASE_URL}/api/faq/load_records", json=records)
     return response
 
 
-@http_timer
-async def post_faq_load_records(question: str, answer: str, doc: str = None, url: str = None) -> dict:
+async def post_faq_load_record(question: str, answer: str, doc: str = None, url: str = None) -> dict:
     """
     Async function that sends a POST request to create new FAQ record.
 
@@ -224,13 +242,16 @@ async def post_faq_load_records(question: str, answer: str, doc: str = None, url
 
     """
 
-    body = [{
+    record = {
         "question": question,
         "answer": answer,
-    }]
-    async with AsyncClient() as client:
-        response = await client.post(f"{BASE_URL}/api/faq/load_records", json=body)
-    return response
+    }
+    # Optional fields are sent only if provided
+    if doc is not None:
+        record["doc"] = doc
+    if url is not None:
+        record["url"] = url
+    return await post_faq_load_records([record])
 
 
 @http_timer
@@ -251,8 +272,8 @@ async def post_faq_random_questions(collection: str, random: int) -> dict:
         "collection": collection,
         "random": random
     }]
-    async with AsyncClient() as client:
-        response = await client.post(f"{BASE_URL}/api/faq/random_questions", json=body)
+    client = get_http_client()
+    response = await client.post(f"{BASE_URL}/api/faq/random_questions", json=body)
     return response
 
 
@@ -274,6 +295,6 @@ async def post_get_rag_answer(content: str) -> dict:
         "role": "user",
         "content": content
     }]
-    async with AsyncClient(timeout=Timeout(60.0, connect=10.0)) as client:
-        response = await client.post(f"{URL}/llm/get_rag_answer", json=body)
+    client = get_http_client()
+    response = await client.post(f"{URL}/llm/get_rag_answer", json=body, timeout=Timeout(60.0, connect=10.0))
     return response
@@ -1,46 +1,122 @@
+import time
+import asyncio
 import streamlit as st
 import zipfile
 import magic
 import pandas as pd
 
-from asyncio import run
+from pymongo.errors import ConnectionFailure, PyMongoError
 
-from src.utils.mongodb_adapter import upload_file
+from src.utils.mongodb_adapter import create_stored_file_record, insert_records, delete_unstored_file_contents
+from src.utils.helpers import run_async, gather_bounded
 from common.session.exceptions import UnknownFileType, UnsupportedFile
 import src.utils.rag_endpoints as endpoints
 from common.logging.st_logger import st_logger
 
 
+# Number of records of extracted files inserted to MongoDB by one request
+UPLOAD_BATCH_SIZE = 16
+# Maximal number of extracted files stored in GridFS at the same time
+ZIP_UPLOAD_CONCURRENCY = 8
+# Number of attempts to store one extracted file, transient MongoDB errors are retried with exponential backoff
+ZIP_UPLOAD_ATTEMPTS = 3
+# File types accepted inside of uploaded ZIP file
+ZIP_SUPPORTED_TYPES = ('application/pdf', 'application/json')
+# Maximal size of one extracted file (200 MB, same as Streamlit upload limit), larger files are not extracted
+ZIP_MAX_FILE_SIZE = 200 * 1024 * 1024
+# Number of bytes from the beginning of extracted file used to recognize its type
+MIME_HEADER_SIZE = 8192
+# libmagic database is loaded only once and shared by all uploads (detector is thread-safe)
+MIME_DETECTOR = magic.Magic(mime=True)
+# Maximal number of pages from uploaded CSV file scraped at the same time
+WEBSCRAPER_CONCURRENCY = 16
+
+
+# Recognizes type of file from its header
+# Supported types are recognized by their signature, libmagic is used only for other files
+def sniff_mime_type(header: bytes) -> str:
+    if header.startswith(b"%PDF-"):
+        return "application/pdf"
+    # libmagic recognizes JSON only if it is complete, header of longer JSON file looks like plain text
+    stripped_header = header.lstrip()
+    if stripped_header[:1] in (b"{", b"[") and not stripped_header.startswith(b"{\\rtf"):
+        return "application/json"
+    return MIME_DETECTOR.from_buffer(header)
+
+
 # A wrapper that wraps around zipfile.ZipExtFile class
 # A wrapped file is compatible with existing file upload infrastructure
+# Only header of the file is kept in memory (type recognition), the rest is streamed from the archive
 class UploadedFileWrapper:
-    def __init__(self, zip_ext_file, file_name):
+    def __init__(self, zip_ext_file, file_info):
         self.zip_ext_file = zip_ext_file
-        self._file_name = file_name
-        self._file_data = zip_ext_file.read()
+        self._file_info = file_info
+        self._header = zip_ext_file.read(MIME_HEADER_SIZE)
+        self._header_position = 0
+        self._mime_type = None
     
-    def read(self):
-        return self._file_data
+    # Data can be read at once or in chunks (GridFS upload), header is returned before the rest of the file
+    def read(self, size=-1):
+        if self._header_position < len(self._header):
+            if size is None or size < 0:
+                data = self._header[self._header_position:] + self.zip_ext_file.read()
+            else:
+                data = self._header[self._header_position:self._header_position+size]
+            self._header_position += len(data)
+            return data
+        return self.zip_ext_file.read(size)
     
     @property
     def size(self):
-        return len(self._file_data)
+        return self._file_info.file_size
     
     @property
     def name(self):
-        return self._file_name
+        return self._file_info.filename
     
     @property
     def type(self):
 
-        mime = magic.Magic(mime=True)
+        # File type is recognized only once
+        if self._mime_type is None:
+            self._mime_type = sniff_mime_type(self._header)
 
-        mime_type = mime.from_buffer(self._file_data)
-
-        if mime_type == "application/octet-stream":
-            raise UnknownFileType(st.session_state.translator("Failed to recognize file type ! File formatting may be broken."))
+        if self._mime_type == "application/octet-stream":
+            # Message is translated when reported, type may be recognized outside of Streamlit thread
+            raise UnknownFileType("Failed to recognize file type ! File formatting may be broken.")
         
-        return mime_type 
+        return self._mime_type 
+
+
+# Extracts one file from ZIP archive and stores its content in GridFS
+# Runs in worker thread, so it must not use Streamlit (errors are reported by the caller)
+def store_zip_entry(zip_archive: zipfile.ZipFile, file_info: zipfile.ZipInfo) -> dict:
+    with zip_archive.open(file_info) as extracted_file:
+        wrapped_file = UploadedFileWrapper(extracted_file, file_info)
+        if wrapped_file.type not in ZIP_SUPPORTED_TYPES:
+            raise UnsupportedFile("Unsupported file type !")
+        return create_stored_file_record(wrapped_file)
+
+
+# Stores one file of ZIP archive, file is extracted again if the upload fails on connection error
+def store_zip_entry_with_retry(zip_archive: zipfile.ZipFile, file_info: zipfile.ZipInfo) -> dict:
+    for attempt in range(ZIP_UPLOAD_ATTEMPTS):
+        try:
+            return store_zip_entry(zip_archive, file_info)
+        except ConnectionFailure as error:
+            if attempt == ZIP_UPLOAD_ATTEMPTS - 1:
+                raise
+            st_logger.warning(f"Upload of '{file_info.filename}' from ZIP file failed, retrying: {error}")
+            time.sleep(2 ** attempt)
+
+
+# Stores files of ZIP archive concurrently, results (records or exceptions) are in the order of 'file_infos'
+async def store_zip_entries(zip_archive: zipfile.ZipFile, file_infos: list) -> list:
+    return await gather_bounded(
+        [asyncio.to_thread(store_zip_entry_with_retry, zip_archive, file_info) for file_info in file_infos],
+        limit=ZIP_UPLOAD_CONCURRENCY,
+        return_exceptions=True
+    )
 
 
 # Function that extracts content of uploaded ZIP file and uploads it to MongoDB history collection
@@ -48,24 +124,48 @@ def process_zip_and_upload(zip_file):
     error_occured = False
     try:
         with zipfile.ZipFile(zip_file) as z:
-            for file_name in z.namelist():
-                if not file_name.endswith('/'):
-                    with z.open(file_name) as extracted_file:
-                        try:
-                            wrapped_file = UploadedFileWrapper(extracted_file, file_name)
-                            if wrapped_file.type is None:
-                                continue
-                            if wrapped_file.type == 'application/pdf' or wrapped_file.type == 'application/json':
-                                upload_file(wrapped_file, "knowledge")
-                            else:
-                                raise UnsupportedFile(st.session_state.translator("Unsupported file type !"))
-                        except (UnknownFileType, UnsupportedFile) as error:
-                            st.error(st.session_state.translator("Error processing file ")+f"'{wrapped_file.name}': "+f"{st.session_state.translator(error)}")
-                            error_occured = True
+            # Entries are checked by their metadata, so directories and oversized files are never opened
+            file_infos = [file_info for file_info in z.infolist() if not file_info.is_dir()]
+            oversized_infos = [file_info for file_info in file_infos if file_info.file_size > ZIP_MAX_FILE_SIZE]
+            file_infos = [file_info for file_info in file_infos if file_info.file_size <= ZIP_MAX_FILE_SIZE]
+            # Contents of the files are stored in GridFS concurrently, records are sent to MongoDB in batches
+            results = run_async(store_zip_entries(z, file_infos))
     except zipfile.BadZipFile as error:
-        st.error(st.session_state.translator("Error processing ZIP file ")+f"'{zipfile.ZipFile(zip_file).filename}': "+f"{st.session_state.translator(error)}")
+        st.error(st.session_state.translator("Error processing ZIP file ")+f"'{getattr(zip_file, 'name', zip_file)}': "+f"{st.session_state.translator(str(error))}")
+        return
+
+    for file_info in oversized_infos:
+        st.error(st.session_state.translator("Error processing file ")+f"'{file_info.filename}': "+f"{st.session_state.translator('File is too large !')}")
         error_occured = True
 
+    records_to_upload = []
+    for file_info, result in zip(file_infos, results):
+        if isinstance(result, (UnknownFileType, UnsupportedFile)):
+            st.error(st.session_state.translator("Error processing file ")+f"'{file_info.filename}': "+f"{st.session_state.translator(str(result))}")
+            error_occured = True
+        elif isinstance(result, Exception):
+            st_logger.error(f"Error during upload of '{file_info.filename}' from ZIP file: {result}")
+            st.error(st.session_state.translator("Error processing file ")+f"'{file_info.filename}': "+f"{result}")
+            error_occured = True
+        else:
+            records_to_upload.append(result)
+    for start in range(0, len(records_to_upload), UPLOAD_BATCH_SIZE):
+        batch = records_to_upload[start:start+UPLOAD_BATCH_SIZE]
+        try:
+            result = insert_records(batch, "knowledge")
+        except PyMongoError as error:
+            st_logger.error(f"Error during upload of records from ZIP file to MongoDB: {error}")
+            result = None
+        if result is None:
+            # Contents already stored in GridFS are deleted, their records were not stored
+            try:
+                delete_unstored_file_contents(batch, "knowledge")
+            except PyMongoError as error:
+                st_logger.error(f"Error during deleting of contents of records not uploaded from ZIP file: {error}")
+            for record in batch:
+                st.error(st.session_state.translator("Error processing file ")+f"'{record['header']['file_name']}'")
+            error_occured = True
+
     if not error_occured:
         st.toast(st.session_state.translator("ZIP file uploaded successfully"))
 
@@ -84,7 +184,7 @@ def webscraper_form(url_input: str, description_input: str) -> None:
     """
     owner = st.session_state.user_name
     # Call endpoint
-    response = run(endpoints.post_webscraper(url_input, description_input, owner))
+    response = run_async(endpoints.post_webscraper(url_input, description_input, owner))
     # Check if the API call was successful
     if endpoints.is_api_call_successful(response):
         st.toast(st.session_state.translator("Webscraper process finished successfully"))
@@ -104,20 +204,33 @@ def webscraper_csv_form(uploaded_file: object) -> None:
     Returns:
         None
     """
-    reader = pd.read_csv(uploaded_file, header=None)
+    # CSV is parsed by pyarrow (installed with Streamlit) straight to Arrow-backed strings
+    # Columns are named after parsing, pyarrow engine does not combine 'names' with rows of extra columns
+    reader = pd.read_csv(uploaded_file, header=None, dtype="string[pyarrow]", engine="pyarrow").iloc[:, :2]
+    reader.columns = ["description", "url"]
     owner = st.session_state.user_name
-    for row in reader.iterrows():
-        description = row[1][0]
-        url = row[1][1]
-        # Call endpoint
-        response = run(endpoints.post_webscraper(url, description, owner))
+    pages = list(reader.itertuples(index=False))
+    # Call endpoint for all pages concurrently
+    responses = run_async(gather_bounded(
+        [endpoints.post_webscraper(page.url, page.description, owner) for page in pages],
+        limit=WEBSCRAPER_CONCURRENCY,
+        return_exceptions=True
+    ))
+    failures = 0
+    for page, response in zip(pages, responses):
         # Check if the API call was successful
-        if endpoints.is_api_call_successful(response):
-            st_logger.info("Page scraped successfully: " + url)
+        if isinstance(response, Exception):
+            st_logger.error(f"Webscraper process failed for {page.url}: {response}")
+            failures += 1
+        elif endpoints.is_api_call_successful(response):
+            st_logger.info("Page scraped successfully: " + page.url)
         else:
             st_logger.error("Webscraper process failed: " + response.text)
-            st.toast(st.session_state.translator("⚠️Webscraper process failed"))
-    st.toast(st.session_state.translator("Webscraper process finished successfully"))
+            failures += 1
+    if failures:
+        st.toast(st.session_state.translator("⚠️Webscraper process failed") + f" ({failures}/{len(pages)})")
+    else:
+        st.toast(st.session_state.translator("Webscraper process finished successfully"))
 
 def faq_form(question: str, answer: str) -> None:    # TODO add url and doc (optional for endpoint)
     """
@@ -132,7 +245,7 @@ def faq_form(question: str, answer: str) -> None:    # TODO add url and doc (opt
 
     """
     # Call endpoint
-    response = run(endpoints.post_faq_load_records(question, answer))
+    response = run_async(endpoints.post_faq_load_record(question, answer))
     # Check if the API call was successful
     if endpoints.is_api_call_successful(response):
         st.toast(st.session_state.translator("Upload process finished successfully"))
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from src.utils.helpers import flatten_record, gather_bounded, get_record_keys
+
+# Tests of helpers used by datasets and selection actions
+
+
+def test_flatten_knowledge_record():
+    record = {
+        "_id": "id-1",
+        "header": {"file_name": "test.pdf", "size": 3, "ingested": True, "type": "application/pdf"},
+        "content_ref": "content-id",
+    }
+    assert flatten_record(record, "knowledge", get_record_keys("knowledge")) == [
+        "id-1", "test.pdf", None, None, 3, True, None, "application/pdf"
+    ]
+
+
+def test_flatten_record_without_header():
+    assert flatten_record({"_id": "id-1"}, "history", get_record_keys("history")) == ["id-1"] + [None] * 8
+    assert flatten_record({"_id": "id-1", "header": None}, "knowledge", get_record_keys("knowledge")) == ["id-1"] + [None] * 7
+
+
+def test_flatten_webscraper_record():
+    record = {"_id": "id-1", "description": "FEI", "url": "https://www.fei.stuba.sk", "content": "page"}
+    assert flatten_record(record, "webscraper", get_record_keys("webscraper")) == [
+        "id-1", "FEI", "https://www.fei.stuba.sk", None, None
+    ]
+
+
+def test_gather_bounded_keeps_order_and_limit():
+    running = 0
+    max_running = 0
+
+    async def job(index):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # Later jobs finish sooner, results must still be in the order of the jobs
+        await asyncio.sleep(0.01 * (10 - index))
+        running -= 1
+        return index
+
+    results = asyncio.run(gather_bounded([job(index) for index in range(10)], limit=3))
+    assert results == list(range(10))
+    assert max_running == 3
+
+
+def test_gather_bounded_exceptions():
+    async def job(index):
+        if index == 1:
+            raise ValueError("failed")
+        return index
+
+    results = asyncio.run(gather_bounded([job(index) for index in range(3)], return_exceptions=True))
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+
+    with pytest.raises(ValueError):
+        asyncio.run(gather_bounded([job(index) for index in range(3)]))
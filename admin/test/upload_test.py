@@ -0,0 +1,77 @@
+import io
+import zipfile
+
+import pytest
+
+from common.session.exceptions import UnknownFileType
+from src.utils.upload import MIME_HEADER_SIZE, UploadedFileWrapper, sniff_mime_type
+
+# Tests of recognition and reading of files extracted from uploaded ZIP file
+
+
+def open_zip_entry(content: bytes, file_name: str = "test.pdf") -> UploadedFileWrapper:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr(file_name, content)
+    z = zipfile.ZipFile(buffer)
+    file_info = z.getinfo(file_name)
+    return UploadedFileWrapper(z.open(file_info), file_info)
+
+
+def test_sniff_pdf():
+    assert sniff_mime_type(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3") == "application/pdf"
+
+
+def test_sniff_json():
+    assert sniff_mime_type(b'{"question": "Kde je FEI?"') == "application/json"
+    assert sniff_mime_type(b'\n  [{"question": ') == "application/json"
+
+
+def test_sniff_rtf_is_not_json():
+    assert sniff_mime_type(b"{\\rtf1\\ansi\\deff0 text}") != "application/json"
+
+
+def test_wrapper_metadata():
+    content = b"%PDF-1.7\n" + b"x" * 100
+    file = open_zip_entry(content)
+    assert file.name == "test.pdf"
+    assert file.size == len(content)
+    assert file.type == "application/pdf"
+
+
+def test_wrapper_unknown_type():
+    file = open_zip_entry(b"\x00\x01\x02\x03" * 16, "test.bin")
+    with pytest.raises(UnknownFileType):
+        file.type
+
+
+def test_wrapper_read_whole_file():
+    content = b"%PDF-1.7\n" + bytes(range(256)) * 100
+    assert open_zip_entry(content).read() == content
+
+
+def test_wrapper_read_in_chunks():
+    # Chunks cross the end of the header, header is returned before the rest of the file
+    content = b"%PDF-1.7\n" + bytes(range(256)) * 100
+    file = open_zip_entry(content)
+    chunks = []
+    while chunk := file.read(3000):
+        chunks.append(chunk)
+    assert b"".join(chunks) == content
+    assert sum(len(chunk) for chunk in chunks[:3]) >= MIME_HEADER_SIZE
+
+
+def test_wrapper_read_rest_after_header_chunk():
+    content = b"%PDF-1.7\n" + bytes(range(256)) * 100
+    file = open_zip_entry(content)
+    header = file.read(10)
+    assert header == content[:10]
+    assert file.read() == content[10:]
+
+
+def test_wrapper_read_short_file():
+    content = b'{"a": 1}'
+    file = open_zip_entry(content, "test.json")
+    assert file.type == "application/json"
+    assert file.read(1024) == content
+    assert file.read(1024) == b""
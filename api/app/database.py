@@ -1,9 +1,15 @@
+import time
+import asyncio
+
+from functools import lru_cache
 from app.config import settings
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo.errors import CollectionInvalid, ConnectionFailure, ExecutionTimeout
 from pymongo.collection import Collection
 
 from chromadb import AsyncHttpClient
+from chromadb.api import AsyncClientAPI
+from chromadb.api.shared_system_client import SharedSystemClient
 
 
 """
@@ -19,6 +25,12 @@ Global variables:
     MONGODB_HISTORY_COLLECTION (str): MongoDB collection name from settings.
     CHROMA_HOST (str): ChromaDB host address from settings.
     CHROMA_PORT (int): ChromaDB port number from settings.
+    MONGODB_MAX_POOL_SIZE (int): Maximal number of connections in the MongoDB connection pool.
+    MONGODB_MIN_POOL_SIZE (int): Number of connections kept open in the MongoDB connection pool.
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS (int): Time limit for finding an available MongoDB server.
+    MONGODB_CONNECT_TIMEOUT_MS (int): Time limit for opening a connection to MongoDB.
+    MONGODB_PING_MAX_TIME_MS (int): Time limit for the ping command of the health check.
+    MONGODB_PING_CACHE_SECONDS (float): How long a successful ping is reused by the health check.
     mongo_db (MongoDB): An instance of the MongoDB class initialized with settings values.
 
 """
@@ -32,6 +44,46 @@ MONGODB_HISTORY_COLLECTION = settings.mongodb_history_collection
 CHROMA_HOST = settings.chroma_host
 CHROMA_PORT = settings.chroma_port
 
+# Connection pool settings of the MongoDB client
+MONGODB_MAX_POOL_SIZE = 50
+MONGODB_MIN_POOL_SIZE = 5
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = 2000
+MONGODB_CONNECT_TIMEOUT_MS = 2000
+# Health check settings
+MONGODB_PING_MAX_TIME_MS = 200
+MONGODB_PING_CACHE_SECONDS = 1.0
+
+
+@lru_cache(maxsize=None)
+def get_mongo_client(host: str, port: int, username: str, password: str) -> MongoClient:
+    """
+    Returns MongoDB client for given connection parameters.
+    The client is created only once per process, so all MongoDB objects
+    (and all collections they access) share its connection pool.
+
+    Args:
+        host (str): The hostname of the database server.
+        port (int): The port number on which the database server is listening.
+        username (str): The username for authenticating with the database.
+        password (str): The password for authenticating with the database.
+
+    Returns:
+        MongoClient: The shared MongoClient instance.
+
+    """
+
+    return MongoClient(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+        minPoolSize=MONGODB_MIN_POOL_SIZE,
+        serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        connectTimeoutMS=MONGODB_CONNECT_TIMEOUT_MS,
+        retryWrites=True,
+    )
+
 
 class MongoDB:
     """
@@ -52,14 +104,23 @@ class MongoDB:
         __init__(host: str, port: int, username: str, password: str, db_name: str, collection_name: str):
             Initializes the MongoDB connection with the provided parameters and connects to the database.
         _connect():
-            Establishes a connection to the MongoDB server and initializes the database and collection attributes.
+            Takes the shared MongoDB client and initializes the database and collection attributes.
         get_collection() -> Collection:
             Returns the collection instance for the specified collection.
+        __getitem__(collection_name: str) -> Collection:
+            Returns the collection instance for the given collection name.
+        get_collection_by_name(collection_name: str, refresh: bool = False) -> Collection:
+            Returns the existing collection, None if it does not exist (optionally asking the server).
         verify_connection() -> bool:
-            Verifies the connection to the MongoDB server by pinging it. Attempts to reconnect if the connection is lost.
+            Verifies the connection to the MongoDB server by pinging it. A successful ping is reused for a short time.
 
     """
 
+    __slots__ = (
+        "host", "port", "username", "password", "db_name", "collection_name",
+        "client", "db", "collection", "_known_collections", "_ensured_indexes", "_last_ping"
+    )
+
     def __init__(self, host: str, port: int, username: str, password: str, db_name: str, collection_name: str):
         """
         Initializes the database connection parameters and establishes a connection.
@@ -83,6 +144,12 @@ class MongoDB:
         self.client = None
         self.db = None
         self.collection = None
+        # Names of collections known to exist, so the server is not asked on every access
+        self._known_collections = set()
+        # Indexes already created by this instance, keys are (collection_name, index_fields, unique)
+        self._ensured_indexes = set()
+        # Time (time.monotonic) of the last successful ping
+        self._last_ping = float("-inf")
         self._connect()
 
     def _connect(self):
@@ -96,7 +163,7 @@ class MongoDB:
         """
 
         try:
-            self.client = MongoClient(
+            self.client = get_mongo_client(
                 host=self.host,
                 port=self.port,
                 username=self.username,
@@ -117,12 +184,41 @@ class MongoDB:
         """
 
         return self.collection
+
+    def __getitem__(self, collection_name: str) -> Collection:
+        """
+        Retrieve collection of the database by name (without asking the server whether it exists).
+
+        Args:
+            collection_name: The name of the collection.
+
+        Returns:
+            Collection: The MongoDB collection object.
+
+        """
+
+        return self.db[collection_name]
     
     def get_collection_by_name(
         self,
         collection_name: str,
+        refresh: bool = False
     ) -> Collection:
-        if collection_name in self.db.list_collection_names():
+        """
+        Retrieves an existing collection. The server is asked only for collections
+        which are not known to exist yet, unless refresh is requested.
+
+        Args:
+            collection_name: The name of the collection.
+            refresh: Indicates whether the server must be asked even for known collections
+                (e.g. the collection may have been dropped by another worker).
+
+        Returns:
+            Collection: The MongoDB collection object, None if the collection does not exist.
+        """
+        if not refresh and collection_name in self._known_collections:
+            return self.db[collection_name]
+        if collection_name in self.list_collection_names():
             return self.db[collection_name]
         return None
 
@@ -145,14 +241,34 @@ class MongoDB:
         """
         collection = self.get_collection_by_name(collection_name)
         if collection is None:
-            self.db.create_collection(collection_name)
+            try:
+                self.db.create_collection(collection_name)
+            except CollectionInvalid:
+                # Collection was created in the meantime (e.g. by another worker)
+                pass
+            self._known_collections.add(collection_name)
             collection = self.db[collection_name]
 
-        if index_fields:
+        index_key = (collection_name, index_fields, unique)
+        if index_fields and index_key not in self._ensured_indexes:
             collection.create_index(list(index_fields), unique=unique)
+            self._ensured_indexes.add(index_key)
 
         return collection
 
+    def forget_collection(self, collection_name: str) -> None:
+        """
+        Removes the collection and its indexes from the known ones, must be called after the collection is dropped.
+
+        Args:
+            collection_name: The name of the collection.
+        """
+        self._known_collections.discard(collection_name)
+        self._ensured_indexes = {
+            index_key for index_key in self._ensured_indexes
+            if index_key[0] != collection_name
+        }
+
     def list_collection_names(self):
         """
         Retrieve a list of all collection names in the connected database.
@@ -161,7 +277,14 @@ class MongoDB:
             list: A list of collection names.
         """
         if self.db is not None:
-            return self.db.list_collection_names()
+            collection_names = self.db.list_collection_names()
+            self._known_collections = set(collection_names)
+            # Indexes of collections dropped in the meantime must be created again with the collections
+            self._ensured_indexes = {
+                index_key for index_key in self._ensured_indexes
+                if index_key[0] in self._known_collections
+            }
+            return collection_names
         else:
             print("Database connection not initialized.")
             return []
@@ -175,42 +298,79 @@ class MongoDB:
 
         """
 
+        # Recent successful ping is reused, so concurrent health checks do not ping the server again
+        if time.monotonic() - self._last_ping < MONGODB_PING_CACHE_SECONDS:
+            return True
         try:
             # Try to ping the MongoDB
-            self.client.admin.command("ping")
+            self.client.admin.command("ping", maxTimeMS=MONGODB_PING_MAX_TIME_MS)
+            self._last_ping = time.monotonic()
             return True
-        except ConnectionFailure:
-            print("Connection lost, reconnecting...")
-            try:
-                # Try to establish a new connection
-                self._connect()
-                return True
-            except ConnectionFailure:
-                print("Connection to MongoDB failed")
-                return False
+        except (ConnectionFailure, ExecutionTimeout):
+            # PyMongo restores the connection pool by itself once the server is reachable again
+            print("Connection to MongoDB failed")
+            return False
 
 
 mongo_db = MongoDB(
-    host=settings.mongodb_host,
-    port=settings.mongodb_port,
-    username=settings.mongodb_user,
-    password=settings.mongodb_password,
-    db_name=settings.mongodb_db,
-    collection_name=settings.mongodb_history_collection
+    host=MONGODB_HOST,
+    port=MONGODB_PORT,
+    username=MONGODB_USER,
+    password=MONGODB_PASS,
+    db_name=MONGODB_DB,
+    collection_name=MONGODB_HISTORY_COLLECTION
 )
 
 
+# ChromaDB client shared by all requests (created on first use, released on shutdown)
+_chroma_client = None
+# Guards creation of the shared client, so concurrent first requests do not create more clients
+_chroma_client_lock = asyncio.Lock()
+
+
+async def get_shared_chromadb_client() -> AsyncClientAPI:
+    """
+    Asynchronously returns the ChromaDB client shared by the whole application.
+    The client is created only once, so requests reuse its connections instead of
+    connecting to ChromaDB again.
+
+    Returns:
+        AsyncClientAPI: The shared instance of the ChromaDB client.
+
+    """
+
+    global _chroma_client
+    if _chroma_client is None:
+        async with _chroma_client_lock:
+            # Client may have been created while waiting for the lock
+            if _chroma_client is None:
+                _chroma_client = await AsyncHttpClient(
+                    host=CHROMA_HOST,
+                    port=CHROMA_PORT
+                )
+    return _chroma_client
+
+
+def release_shared_chromadb_client() -> None:
+    """
+    Releases the shared ChromaDB client on application shutdown.
+    ChromaDB client has no close method, so its cached system (with HTTP connections) is stopped instead.
+
+    """
+
+    global _chroma_client
+    if _chroma_client is not None:
+        _chroma_client = None
+        SharedSystemClient.clear_system_cache()
+
+
 async def get_chromadb_client():
     """
-    Asynchronously creates and yields a ChromaDB client.
+    Asynchronously yields the shared ChromaDB client (FastAPI dependency).
 
     Yields:
-        AsyncHttpClient: An instance of the ChromaDB client.
+        AsyncClientAPI: The shared instance of the ChromaDB client.
 
     """
  
-    chroma_client = await AsyncHttpClient(
-        host=CHROMA_HOST,
-        port=CHROMA_PORT
-    )
-    yield chroma_client
+    yield await get_shared_chromadb_client()
@@ -41,6 +41,7 @@ from app.routers.mcp import (
     get_available_tools
 )
 from app.mcp.client import mcp_client
+from app.database import release_shared_chromadb_client
 
 """
 This module initializes and configures the FastAPI application for the project.
@@ -92,6 +93,7 @@ async def lifespan(app: FastAPI):
     yield
     scheduler.shutdown(wait=False)
     await mcp_client.close()
+    release_shared_chromadb_client()
 
 ##### ENDPOINTS #####
 
@@ -103,39 +105,44 @@ app = FastAPI(
 )
 api_router = APIRouter(prefix="/api")
 
-# Basic endpoints
-api_router.include_router(status.router)
-api_router.include_router(ingest.router)
-api_router.include_router(vector_search.router)
-api_router.include_router(delete_embeddings.router)
-
-# Common
-api_router.include_router(clear_chroma_collection.router)
-api_router.include_router(clear_mongo_collection.router)
-api_router.include_router(delete_one_mongo_record.router)
-api_router.include_router(delete_one_chroma_record.router)
-api_router.include_router(get_mongo_records.router)
-api_router.include_router(drop_chroma_collection.router)
-api_router.include_router(drop_mongo_collection.router)
-
-# FAQ
-api_router.include_router(random_questions.router)
-api_router.include_router(similar_questions.router)
-api_router.include_router(load_faq_data.router)
-
-# Webscraper
-api_router.include_router(webscraper.router)
-api_router.include_router(webscraper_batch.router)
-api_router.include_router(get_chunks.router)
-
-# Tests
-api_router.include_router(testers_delete_mongo_records.router)
-api_router.include_router(testers_get_mongo_records.router)
-api_router.include_router(testers_upload_records.router)
-# api_router.include_router(start_llm_test.router)
-
-# MCP
-api_router.include_router(call_tool.router)
-api_router.include_router(get_available_tools.router)
+ROUTERS = (
+    # Basic endpoints
+    status.router,
+    ingest.router,
+    vector_search.router,
+    delete_embeddings.router,
+
+    # Common
+    clear_chroma_collection.router,
+    clear_mongo_collection.router,
+    delete_one_mongo_record.router,
+    delete_one_chroma_record.router,
+    get_mongo_records.router,
+    drop_chroma_collection.router,
+    drop_mongo_collection.router,
+
+    # FAQ
+    random_questions.router,
+    similar_questions.router,
+    load_faq_data.router,
+
+    # Webscraper
+    webscraper.router,
+    webscraper_batch.router,
+    get_chunks.router,
+
+    # Tests
+    testers_delete_mongo_records.router,
+    testers_get_mongo_records.router,
+    testers_upload_records.router,
+    # start_llm_test.router,
+
+    # MCP
+    call_tool.router,
+    get_available_tools.router,
+)
+
+for router in ROUTERS:
+    api_router.include_router(router)
 
 app.include_router(api_router)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, List
 
 from app.mcp.tools.chromadb_get_webscrapes import ChromaDBGetWebScrapesTool
@@ -6,6 +7,7 @@ from app.mcp.tools.mongodb_search_knowledge import MongoDBSearchKnowledgeTool
 class MCPClient:
     def __init__(self):
         self._tools = {}
+        self._tool_configs = []
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -16,25 +18,24 @@ class MCPClient:
         self._tools["chromadb"] = ChromaDBGetWebScrapesTool()
         self._tools["mongodb"] = MongoDBSearchKnowledgeTool()
 
-        for tool in self._tools.values():
-            await tool.initialize()
+        # Tools connect to their databases concurrently
+        await asyncio.gather(*(tool.initialize() for tool in self._tools.values()))
 
+        # Tool configurations are static, so they are built only once
+        self._tool_configs = [tool.get_tool_config() for tool in self._tools.values()]
         self._initialized = True
 
     async def close(self) -> None:
         """Close all tool connections."""
-        for tool in self._tools.values():
-            await tool.close()
+        await asyncio.gather(
+            *(tool.close() for tool in self._tools.values()),
+            return_exceptions=True
+        )
 
-    async def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get a list of available tools for OpenAI."""
-        tool_configs = []
+    def get_available_tools(self) -> List[Dict[str, Any]]:
+        """Get a list of available tools for OpenAI (prepared during initialization)."""
+        return self._tool_configs
 
-        for tool in self._tools.values():
-            tool_configs.append(tool.get_tool_config())
-
-        return tool_configs
-        
     async def call_tool(
         self,
         tool_name: str,
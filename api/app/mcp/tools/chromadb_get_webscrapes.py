@@ -1,8 +1,45 @@
 import asyncio
+import logging
 from typing import Dict, Any
-from app.database import get_chromadb_client
+from app.database import get_shared_chromadb_client
 from app.utils import initialize_embedding_function
 
+logger = logging.getLogger(__name__)
+
+# Tool configuration for OpenAI API (static, built only once)
+_TOOL_CONFIG = {
+    "type": "function",
+    "function": {
+        "name": "chromadb",
+        "description": "Search for information in the ChromaDB vector database",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["query", "stats"],
+                    "description": "The operation to perform (query or get stats)"
+                },
+                "query": {
+                    "type": "string",
+                    "description": "The query to search for in the database (for query operation)"
+                },
+                "n_results": {
+                    "type": "integer",
+                    "description": "Number of results to return (for query operation)",
+                    "default": 3
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "Optional filter to apply to the search (for query operation)"
+                }
+            },
+            "required": ["operation"]
+        }
+    }
+}
+
+
 class ChromaDBGetWebScrapesTool:
     def __init__(self):
         self._client = None
@@ -18,15 +55,16 @@ class ChromaDBGetWebScrapesTool:
         max_retries = 5
         for i in range(max_retries):
             try:
-                self._client = await anext(get_chromadb_client())
+                self._client = await get_shared_chromadb_client()
                 await self._client.heartbeat()
                 break
             except Exception as e:
                 if i < max_retries - 1:
-                    print(f"Failed to connect to ChromaDB, retrying in 5 seconds... ({e})")
-                    await asyncio.sleep(5)
+                    # Exponential backoff (1, 2, 4, 8 seconds) between attempts
+                    logger.warning(f"Failed to connect to ChromaDB, retrying in {2 ** i} seconds... ({e})")
+                    await asyncio.sleep(2 ** i)
                 else:
-                    raise e
+                    raise
         self._embedding_function = initialize_embedding_function()
         self._collection = await self._client.get_or_create_collection(
             name=self._collection_name,
@@ -41,37 +79,7 @@ class ChromaDBGetWebScrapesTool:
 
     def get_tool_config(self) -> Dict[str, Any]:
         """Get the tool configuration for OpenAI API."""
-        return {
-            "type": "function",
-            "function": {
-                "name": "chromadb",
-                "description": "Search for information in the ChromaDB vector database",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "enum": ["query", "stats"],
-                            "description": "The operation to perform (query or get stats)"
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "The query to search for in the database (for query operation)"
-                        },
-                        "n_results": {
-                            "type": "integer",
-                            "description": "Number of results to return (for query operation)",
-                            "default": 3
-                        },
-                        "filter": {
-                            "type": "object",
-                            "description": "Optional filter to apply to the search (for query operation)"
-                        }
-                    },
-                    "required": ["operation"]
-                }
-            }
-        }
+        return _TOOL_CONFIG
 
     async def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an operation on ChromaDB."""
@@ -109,8 +117,6 @@ class ChromaDBGetWebScrapesTool:
                 query_args["where"] = filter_dict
 
             results = await self._collection.query(**query_args)
-            
-            print(f"ChromaDB raw results: {results}")
 
             return {
                 "documents": results.get("documents", [[]])[0],
@@ -120,7 +126,7 @@ class ChromaDBGetWebScrapesTool:
             }
             
         except Exception as e:
-            print(f"ChromaDB query error: {str(e)}")
+            logger.exception("ChromaDB query error")
             return {"error": f"Query failed: {str(e)}"}
 
     async def _execute_stats(self) -> Dict[str, Any]:
@@ -1,11 +1,105 @@
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any
 
+from pybase64 import b64encode
+
 from app.database import mongo_db
 
 from bson import ObjectId, Binary
 from datetime import datetime
 
 
+def _encode_binary(value: bytes) -> str:
+    """Encode binary value as base64 string."""
+    return b64encode(value).decode('ascii')
+
+
+# Encoders of MongoDB-specific types, looked up by the exact type of the value
+_ENCODERS = {
+    ObjectId: str,
+    Binary: _encode_binary,
+    bytes: _encode_binary,
+    datetime: datetime.isoformat,
+}
+
+# Maximal number of documents fetched by one round-trip of find operation
+MAX_FIND_BATCH_SIZE = 1000
+
+# Types which are JSON-serializable as they are
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode one non-container value of MongoDB document into JSON-serializable type."""
+    encoder = _ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if type(value) not in _PLAIN_TYPES:
+        # Subclasses of the MongoDB types are encoded as their base type
+        for value_type, encoder in _ENCODERS.items():
+            if isinstance(value, value_type):
+                return encoder(value)
+    return value
+
+
+@lru_cache(maxsize=128)
+def _cached_sort_spec(sort_items: tuple) -> list:
+    """Convert sort criteria items into pymongo sort spec, repeated criteria reuse the spec."""
+    return list(sort_items)
+
+
+def _sort_spec(sort: Dict[str, Any]) -> list:
+    """Get pymongo sort spec (list of (field, direction) pairs) for sort criteria."""
+    sort_items = tuple(sort.items())
+    try:
+        return _cached_sort_spec(sort_items)
+    except TypeError:
+        # Criteria with unhashable values (e.g. {"$meta": "textScore"}) are not cached
+        return list(sort_items)
+
+
+# Tool configuration for OpenAI API (static, built only once)
+_TOOL_CONFIG = {
+    "type": "function",
+    "function": {
+        "name": "mongodb",
+        "description": "Query or modify data in MongoDB",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "description": "The operation to perform",
+                    "enum": ["find", "find_one", "count"]
+                },
+                "filter": {
+                    "type": "object",
+                    "description": "Filter criteria for the operation"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of documents to return"
+                },
+                "sort": {
+                    "type": "object",
+                    "description": "Sort criteria for find operations"
+                },
+                "projection": {
+                    "type": "object",
+                    "description": "Fields returned by find and find_one operations, e.g. {\"header.file_name\": 1}"
+                },
+                "hint": {
+                    "type": ["string", "object"],
+                    "description": "Index name or key spec used by find and count operations"
+                }
+            },
+            "required": ["operation"]
+        }
+    }
+}
+
+
 class MongoDBSearchKnowledgeTool:
     def __init__(self):
         self._client = mongo_db
@@ -26,44 +120,16 @@ class MongoDBSearchKnowledgeTool:
 
     def get_tool_config(self) -> Dict[str, Any]:
         """Get the tool configuration for OpenAI API."""
-        return {
-            "type": "function",
-            "function": {
-                "name": "mongodb",
-                "description": "Query or modify data in MongoDB",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "description": "The operation to perform",
-                            "enum": ["find", "find_one", "count"]
-                        },
-                        "filter": {
-                            "type": "object",
-                            "description": "Filter criteria for the operation"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of documents to return"
-                        },
-                        "sort": {
-                            "type": "object",
-                            "description": "Sort criteria for find operations"
-                        }
-                    },
-                    "required": ["operation"]
-                }
-            }
-        }
+        return _TOOL_CONFIG
 
     def _encode_mongo_document(self, doc):
         """
-        Recursively encodes a MongoDB document into JSON-serializable types.
+        Encodes a MongoDB document into JSON-serializable types.
 
         This method traverses the input document, converting special MongoDB types
         such as ObjectId, Binary, and datetime into string representations suitable
-        for JSON serialization. It handles nested dictionaries and lists.
+        for JSON serialization. Nested dictionaries and lists are walked with an explicit
+        stack instead of recursion, values are encoded by the exact type lookup in _ENCODERS.
 
         Args:
             doc: The MongoDB document or value to encode. Can be a dict, list, ObjectId,
@@ -73,56 +139,78 @@ class MongoDBSearchKnowledgeTool:
             The encoded document or value, with all MongoDB-specific types converted
             to JSON-serializable representations.
         """
-        if isinstance(doc, dict):
-            return {k: self._encode_mongo_document(v) for k, v in doc.items()}
-        elif isinstance(doc, list):
-            return [self._encode_mongo_document(item) for item in doc]
-        elif isinstance(doc, ObjectId):
-            return str(doc)
-        elif isinstance(doc, Binary):
-            import base64
-            return base64.b64encode(doc).decode('ascii')
-        elif isinstance(doc, datetime):
-            return doc.isoformat()
-        elif isinstance(doc, bytes):
-            import base64
-            return base64.b64encode(doc).decode('ascii')
-        else:
-            return doc
+        if not isinstance(doc, (dict, list)):
+            return _encode_value(doc)
+
+        encoded_doc = {} if isinstance(doc, dict) else []
+        # Pairs of (source container, encoded container) waiting to be filled
+        stack = [(doc, encoded_doc)]
+        while stack:
+            source, target = stack.pop()
+            is_dict = isinstance(source, dict)
+            for key, value in (source.items() if is_dict else enumerate(source)):
+                if isinstance(value, dict):
+                    encoded = {}
+                    stack.append((value, encoded))
+                elif isinstance(value, list):
+                    encoded = []
+                    stack.append((value, encoded))
+                else:
+                    encoded = _encode_value(value)
+                if is_dict:
+                    target[key] = encoded
+                else:
+                    target.append(encoded)
+        return encoded_doc
 
     async def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a MongoDB operation."""
+        """Execute a MongoDB operation (blocking pymongo calls run in a worker thread)."""
+        return await asyncio.to_thread(self._execute_operation, args)
+
+    def _execute_operation(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a MongoDB operation synchronously."""
         operation = args.get("operation")
         filter_dict = args.get("filter", {})
         limit = args.get("limit", 0)
         sort = args.get("sort", None)
+        # Empty projection would return only '_id' in pymongo, so it means whole documents here
+        projection = args.get("projection") or None
+        hint = args.get("hint", None)
+        # Key spec is passed to pymongo as list of (field, direction) pairs
+        if isinstance(hint, dict):
+            hint = list(hint.items())
 
         if not operation:
             return {"error": "Operation is required"}
 
         if operation == "find":
-            cursor = self._collection.find(filter_dict)
+            cursor = self._collection.find(filter_dict, projection)
 
             if limit > 0:
-                cursor = cursor.limit(limit)
+                # Batches match the requested number of documents, so no extra getMore round-trips are needed
+                cursor = cursor.limit(limit).batch_size(min(limit, MAX_FIND_BATCH_SIZE))
             if sort:
-                cursor = cursor.sort([(k, v) for k, v in sort.items()])
-                
-            results = []
-            for doc in cursor:
-                doc = self._encode_mongo_document(doc=doc)
-                results.append(doc)
+                cursor = cursor.sort(_sort_spec(sort))
+            if hint:
+                cursor = cursor.hint(hint)
                 
+            results = list(map(self._encode_mongo_document, cursor))
             return {"results": results}
 
         elif operation == "find_one":
-            result = self._collection.find_one(filter_dict)
+            result = self._collection.find_one(filter_dict, projection)
             if result:
                 result = self._encode_mongo_document(result)
             return {"result": result}
 
         elif operation == "count":
-            count = self._collection.count_documents(filter_dict)
+            if not filter_dict:
+                # Count of whole collection is taken from its metadata, no documents are scanned
+                count = self._collection.estimated_document_count()
+            elif hint:
+                count = self._collection.count_documents(filter_dict, hint=hint)
+            else:
+                count = self._collection.count_documents(filter_dict)
             return {"count": count}
 
         else:
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict, Any, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -30,15 +31,16 @@ async def random_questions(
             a statuses of the operations, and a lists of retrieved questions.
     """
 
-    results = []
-    
-    for query in queries:
-        result = await query_chroma(db_client=db_client, query=query)
+    # Queries are independent, so they are sent to Chroma concurrently
+    results = await asyncio.gather(
+        *(query_chroma(db_client=db_client, query=query) for query in queries)
+    )
+
+    for result in results:
         if result.status != status.HTTP_200_OK:
             raise HTTPException(
                 status_code=result.status,
                 detail=result.message
             )
-        results.append(result)
 
     return results
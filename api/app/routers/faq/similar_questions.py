@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Dict, Any, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -31,7 +32,8 @@ async def similar_questions(
     Returns:
         List[SimilarQuestionResponse]: A list of structured responses, one for each query.
     """
-    results = []
+    # Parameters of validated queries (coroutines are created only after all queries are valid)
+    query_params = []
 
     for query in queries:
         search = query.get("search", "").strip()
@@ -50,20 +52,23 @@ async def similar_questions(
                 detail="Collection name cannot be empty."
             )
 
-        received_questions = await query_chroma(
-            db_client=db_client,
-            search=search,
-            collection=collection,
-            top=top,
-            similarity=similarity
-        )
+        query_params.append({
+            "search": search,
+            "collection": collection,
+            "top": top,
+            "similarity": similarity
+        })
 
+    # Queries are independent, so they are sent to Chroma concurrently
+    results = await asyncio.gather(
+        *(query_chroma(db_client=db_client, **params) for params in query_params)
+    )
+
+    for received_questions in results:
         if received_questions.status != status.HTTP_200_OK:
             raise HTTPException(
                 status_code=received_questions.status,
                 detail=received_questions.message
             )
 
-        results.append(received_questions)
-
     return results
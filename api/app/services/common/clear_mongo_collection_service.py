@@ -25,7 +25,8 @@ async def clear_collection(
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        collection = mongo_db.get_collection_by_name(collection_name)
+        # Server is asked, the collection may have been dropped by another worker
+        collection = mongo_db.get_collection_by_name(collection_name, refresh=True)
         if collection is None:
             return return_clear_collection_response(
                 message="Collection doesn't exist",
@@ -32,15 +32,16 @@ async def drop_collection(
         )
 
     try:
-        existing_collections = mongo_db.list_collection_names()
-        if collection_name not in existing_collections:
+        # Server is asked, the collection may have been dropped by another worker
+        collection_to_drop = mongo_db.get_collection_by_name(collection_name, refresh=True)
+        if collection_to_drop is None:
             return _make_response(
                 message=f"Collection '{collection_name}' does not exist.",
                 status_code=status.HTTP_404_NOT_FOUND
             )
 
-        collection_to_drop = mongo_db.get_collection_by_name(collection_name)
         collection_to_drop.drop()
+        mongo_db.forget_collection(collection_name)
 
         return _make_response(
             message=f"Collection '{collection_name}' has been successfully dropped.",
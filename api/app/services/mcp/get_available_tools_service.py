@@ -13,7 +13,7 @@ async def available_tools_service() -> AvailableToolsResponse:
     """
     try:
         return AvailableToolsResponse(
-            tools_list = await mcp_client.get_available_tools()
+            tools_list = mcp_client.get_available_tools()
         )
     except Exception as e:
         raise HTTPException(
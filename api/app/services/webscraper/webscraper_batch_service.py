@@ -16,7 +16,7 @@ from pymongo.collection import Collection as MongoCollection
 from chromadb.api.models import Collection as ChromaCollection
 
 from app.routers.schemas import Page
-from app.database import mongo_db, get_chromadb_client
+from app.database import mongo_db, get_shared_chromadb_client
 from app.utils import EMBEDDING_MODEL, OPENAI_API_KEY
 from app.routers.schemas import WebScraperBatchResponse
 from app.services.webscraper.webscraper_service import (
@@ -673,7 +673,7 @@ async def extract_pages_content(pages: List[Page]) -> JSONResponse:
         )
 
         logger.info("Getting ChromaDB client and collection.")
-        chroma_client = await anext(get_chromadb_client())
+        chroma_client = await get_shared_chromadb_client()
         chromadb_collection = await chroma_client.get_or_create_collection(
             name=webscraper_collection_name,
             metadata={"hnsw:space": "cosine"}
@@ -19,7 +19,7 @@ from fastapi.responses import JSONResponse
 from bs4 import BeautifulSoup, Comment
 
 from app.routers.schemas import WebScraperResponse
-from app.database import mongo_db, get_chromadb_client
+from app.database import mongo_db, get_shared_chromadb_client
 from app.utils import initialize_embedding_function
 
 logging.basicConfig(level=logging.INFO)
@@ -267,7 +267,7 @@ async def save_to_mongo_and_update_vector_db(
         ("url", pymongo.ASCENDING),
         ("version", pymongo.DESCENDING)
     )
-    chroma_client = await anext(get_chromadb_client())
+    chroma_client = await get_shared_chromadb_client()
     embedding_function = initialize_embedding_function()
     chromadb_collection = await chroma_client.get_or_create_collection(
         name=webscraper_colection_name,
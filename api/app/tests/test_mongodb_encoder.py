@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+
+from bson import Binary, ObjectId
+
+from app.mcp.tools.mongodb_search_knowledge import MongoDBSearchKnowledgeTool
+
+
+"""
+
+This module contains test cases for encoding of MongoDB documents returned by the MongoDB MCP tool.
+Encoded documents must contain only JSON-serializable values.
+
+"""
+
+tool = MongoDBSearchKnowledgeTool()
+
+OBJECT_ID = ObjectId("65f1c0ffee0000000000abcd")
+DATE_TIME = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class SubclassedDateTime(datetime):
+    pass
+
+
+class SubclassedDict(dict):
+    pass
+
+
+# Test cases:
+
+def test_encode_plain_values():
+    assert tool._encode_mongo_document("text") == "text"
+    assert tool._encode_mongo_document(42) == 42
+    assert tool._encode_mongo_document(1.5) == 1.5
+    assert tool._encode_mongo_document(True) is True
+    assert tool._encode_mongo_document(None) is None
+
+
+def test_encode_mongo_types():
+    assert tool._encode_mongo_document(OBJECT_ID) == "65f1c0ffee0000000000abcd"
+    assert tool._encode_mongo_document(DATE_TIME) == "2024-03-01T12:30:00+00:00"
+    assert tool._encode_mongo_document(b"abc") == "YWJj"
+    assert tool._encode_mongo_document(Binary(b"abc")) == "YWJj"
+
+
+def test_encode_subclassed_values():
+    assert tool._encode_mongo_document(SubclassedDateTime(2024, 3, 1)) == "2024-03-01T00:00:00"
+    assert tool._encode_mongo_document(SubclassedDict(_id=OBJECT_ID)) == {"_id": "65f1c0ffee0000000000abcd"}
+
+
+def test_encode_nested_document():
+    document = {
+        "_id": OBJECT_ID,
+        "header": {"file_name": "test.pdf", "date": DATE_TIME, "ingested": False},
+        "content": Binary(b"abc"),
+        "chunks": [b"abc", [OBJECT_ID, {"size": 3}], []],
+        "empty": {},
+    }
+    assert tool._encode_mongo_document(document) == {
+        "_id": "65f1c0ffee0000000000abcd",
+        "header": {"file_name": "test.pdf", "date": "2024-03-01T12:30:00+00:00", "ingested": False},
+        "content": "YWJj",
+        "chunks": ["YWJj", ["65f1c0ffee0000000000abcd", {"size": 3}], []],
+        "empty": {},
+    }
+
+
+def test_encode_keeps_order_of_list():
+    assert tool._encode_mongo_document([1, [2, 3], {"a": [4]}, 5]) == [1, [2, 3], {"a": [4]}, 5]
+
+
+def test_encode_does_not_modify_document():
+    document = {"_id": OBJECT_ID, "items": [DATE_TIME]}
+    tool._encode_mongo_document(document)
+    assert document == {"_id": OBJECT_ID, "items": [DATE_TIME]}
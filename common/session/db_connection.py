@@ -1,5 +1,7 @@
 import os
 
+from functools import lru_cache
+from gridfs import GridFS, GridIn, GridOut
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 
@@ -9,6 +11,43 @@ This module contains the Database class for MongoDB connection and operations.
 
 """
 
+# Connection pool settings shared by all MongoDB clients of the process
+MAX_POOL_SIZE = 50
+MIN_POOL_SIZE = 5
+SOCKET_TIMEOUT_MS = 30000
+MAX_IDLE_TIME_MS = 300000
+
+
+@lru_cache(maxsize=None)
+def get_client(hostname: str, port: int, username: str, password: str) -> MongoClient:
+    """
+    Returns MongoDB client for given connection parameters.
+
+    The client is created only once per process and its connection pool is shared
+    by all Database objects (and all Streamlit sessions) with the same parameters.
+
+    Args:
+        - hostname (str): The hostname of the MongoDB server.
+        - port (int): The port number of the MongoDB server.
+        - username (str): The username for authentication.
+        - password (str): The password for authentication.
+
+    Returns:
+        pymongo.MongoClient: The MongoDB client object.
+
+    """
+    return MongoClient(
+        hostname,
+        port,
+        username=username,
+        password=password,
+        maxPoolSize=MAX_POOL_SIZE,
+        minPoolSize=MIN_POOL_SIZE,
+        socketTimeoutMS=SOCKET_TIMEOUT_MS,
+        maxIdleTimeMS=MAX_IDLE_TIME_MS,
+        retryWrites=True,
+    )
+
 
 class Database:
     """
@@ -21,8 +60,13 @@ class Database:
 
     Methods:
         - __init__(): Initializes the Database object with the provided parameters.
-        - verify_connection(): Verifies the connection to MongoDB and tries reconnecting if the connection is lost.
+        - verify_connection(): Verifies the connection to MongoDB.
         - set_collection(new_collection, new_database=None): Sets the collection in the database.
+        - put_file(data): Stores binary data in GridFS of the default database.
+        - new_file(): Creates a new file in GridFS of the default database to be written in chunks.
+        - get_file(file_id): Loads binary data from GridFS of the default database.
+        - open_file(file_id): Opens binary data from GridFS of the default database for streaming.
+        - delete_file(file_id): Deletes binary data from GridFS of the default database.
 
     """
 
@@ -60,9 +104,9 @@ class Database:
             "MONGODB_HISTORY_COLLECTION"
         )
 
-        # Create a MongoDB client
-        self.client = MongoClient(
-            self.hostname, self.port, username=self.username, password=self.password
+        # Get a shared MongoDB client
+        self.client = get_client(
+            self.hostname, self.port, self.username, self.password
         )
         self.db = self.client[self.name_db]
         self.collection = self.db[self.name_collection]
@@ -72,7 +116,8 @@ class Database:
         """
         Verifies the connection to the MongoDB server.
 
-        If connection is invalid, tries reconnecting.
+        The shared client is not rebuilt on failure, pymongo restores
+        its connection pool by itself once the server is reachable again.
 
         Args:
             None
@@ -80,33 +125,16 @@ class Database:
         Returns:
             bool: True if the connection is successful, False otherwise.
 
-        Raises:
-            ConnectionFailure: If the connection to the MongoDB server fails.
-
         """
         try:
             # Try to ping the MongoDB
             self.client.admin.command("ping")
 
             return True
-        # If the connection fails, try to reconnect
         except ConnectionFailure:
-            print("Connection lost, reconnecting...")
-            try:
-                # Try to establish a new connection
-                self.client = MongoClient(
-                    self.hostname,
-                    self.port,
-                    username=self.username,
-                    password=self.password,
-                )
-
-                return True
-            # If the second attempt at the connection fails, return False
-            except ConnectionFailure:
-                print("Connection to MongoDB failed")
-
-                return False
+            print("Connection to MongoDB failed")
+
+            return False
 
     # Sets collection in DB (default option is for conversation history)
     def set_collection(self, new_collection: str, new_database: str = None) -> None:
@@ -130,6 +158,80 @@ class Database:
         self.db = self.client[new_database]
         self.collection = self.db[new_collection]
 
+    # Stores binary data (e.g. images) outside of the documents
+    def put_file(self, data: bytes, **kwargs) -> object:
+        """
+        Stores binary data in GridFS of the default database, so large blobs
+        are not transferred with every query of the referencing documents.
+
+        Args:
+            - data (bytes): The binary data (or file-like object, read in chunks) to be stored.
+            - **kwargs: Additional GridFS file attributes (e.g. _id).
+
+        Returns:
+            ObjectId: The ID of the stored file.
+
+        """
+        return GridFS(self.client[self.name_db]).put(data, **kwargs)
+
+    # Creates new file in GridFS, data are written to it in chunks
+    def new_file(self, **kwargs) -> GridIn:
+        """
+        Creates a new file in GridFS of the default database, so large binary data
+        can be written in chunks (e.g. while being read from an upload).
+
+        Args:
+            - **kwargs: GridFS file attributes (e.g. filename, contentType).
+
+        Returns:
+            gridfs.GridIn: The file-like object to write the binary data to (close it when finished).
+
+        """
+        return GridFS(self.client[self.name_db]).new_file(**kwargs)
+
+    # Loads binary data stored by put_file
+    def get_file(self, file_id: object) -> bytes:
+        """
+        Loads binary data from GridFS of the default database.
+
+        Args:
+            - file_id (ObjectId): The ID of the stored file.
+
+        Returns:
+            bytes: The binary data of the file.
+
+        """
+        return GridFS(self.client[self.name_db]).get(file_id).read()
+
+    # Opens binary data stored by put_file for reading in chunks
+    def open_file(self, file_id: object) -> GridOut:
+        """
+        Opens binary data from GridFS of the default database as a file-like object,
+        so the data can be streamed without loading it into memory at once.
+
+        Args:
+            - file_id (ObjectId): The ID of the stored file.
+
+        Returns:
+            gridfs.GridOut: The file-like object with the binary data.
+
+        """
+        return GridFS(self.client[self.name_db]).get(file_id)
+
+    # Deletes binary data stored by put_file
+    def delete_file(self, file_id: object) -> None:
+        """
+        Deletes binary data from GridFS of the default database.
+
+        Args:
+            - file_id (ObjectId): The ID of the stored file.
+
+        Returns:
+            None
+
+        """
+        GridFS(self.client[self.name_db]).delete(file_id)
+
     def __query_validator():
         pass
 
@@ -0,0 +1,7 @@
+from src.utils.news_scraper import migrate_news_images
+
+
+# One-shot migration of inline news images to GridFS (safe to run repeatedly)
+#   python migrate_news_images.py
+if __name__ == "__main__":
+    migrate_news_images()
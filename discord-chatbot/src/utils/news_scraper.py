@@ -1,7 +1,11 @@
 import discord
 import datetime
+import io
 from bson import ObjectId
+from gridfs.errors import FileExists
+from pymongo.errors import PyMongoError
 import os
+from PIL import Image
 from dotenv import load_dotenv
 
 
@@ -9,6 +13,31 @@ from common.logging.global_logger import logger
 from common.session.db_connection import mongo_db
 from common.llm.title_flow import conversation_title_agent
 
+# Maximal size of the image thumbnail displayed in news lists
+THUMBNAIL_SIZE = (256, 256)
+
+
+def create_thumbnail(image: bytes) -> bytes:
+    """
+    Creates a downscaled thumbnail of the news image, so news lists
+    do not have to decode full resolution images.
+
+    Args:
+        - image (bytes): Raw bytes of the original image
+
+    Returns:
+        - bytes: Raw bytes of the thumbnail (PNG), None if the image can not be decoded
+    """
+    try:
+        thumbnail = Image.open(io.BytesIO(image))
+        thumbnail.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+    except Exception as e:
+        logger.error(f"Error during creating of thumbnail: {e}")
+        return None
+
 
 async def create_news_record(message: discord.Message) -> dict:
     """
@@ -34,14 +63,15 @@ async def create_news_record(message: discord.Message) -> dict:
     except Exception as e:
         logger.error(e)
         return None
-    # Template record
+    # Template record (full image is stored in GridFS, record holds only reference)
     record = {
         "message_id": id,
         "date_time": date_time,
         "author": author,
         "title": conversation_title_agent(str(content)),
         "content": content,
-        "image": image
+        "image_ref": mongo_db.put_file(image) if image else None,
+        "thumbnail": create_thumbnail(image) if image else None
     }
     return record
 
@@ -86,3 +116,62 @@ async def is_message_stored(message: discord.Message) -> bool:
     except ConnectionError as e:
         logger.error(e)
         return False
+
+
+def store_migrated_image(image: bytes, record_id: ObjectId) -> ObjectId:
+    """
+    Stores inline image of the news record in GridFS under the ID of the record.
+    If the image was already stored by an interrupted migration, the stored file is reused.
+
+    Args:
+        - image (bytes): Raw bytes of the image
+        - record_id (ObjectId): The ID of the news record
+
+    Returns:
+        - ObjectId: The ID of the stored file
+    """
+    try:
+        return mongo_db.put_file(image, _id=record_id)
+    except FileExists:
+        return record_id
+
+
+def migrate_news_images() -> int:
+    """
+    Moves images stored inline in news records to GridFS and replaces them
+    with 'image_ref' reference and thumbnail. Records migrated without thumbnail
+    get it from the stored image. Already migrated records are skipped,
+    so the migration can be run repeatedly (see migrate_news_images.py).
+
+    Args:
+        None
+
+    Returns:
+        - int: Number of migrated records
+    """
+    mongo_db.set_collection("student_news")
+    migrated = 0
+    try:
+        for record in mongo_db.collection.find({"image": {"$exists": True}}, {"image": 1}):
+            image = record["image"]
+            mongo_db.collection.update_one(
+                {"_id": record["_id"]},
+                {
+                    "$unset": {"image": ""},
+                    "$set": {
+                        "image_ref": store_migrated_image(image, record["_id"]) if image else None,
+                        "thumbnail": create_thumbnail(image) if image else None
+                    }
+                }
+            )
+            migrated += 1
+        # Records migrated before thumbnails were introduced
+        for record in mongo_db.collection.find({"image_ref": {"$ne": None}, "thumbnail": {"$exists": False}}, {"image_ref": 1}):
+            thumbnail = create_thumbnail(mongo_db.get_file(record["image_ref"]))
+            mongo_db.collection.update_one({"_id": record["_id"]}, {"$set": {"thumbnail": thumbnail}})
+            migrated += 1
+    except PyMongoError as e:
+        logger.error(f"Migration of news images failed: {e}")
+    if migrated:
+        logger.info(f"Migrated images of {migrated} news records to GridFS")
+    return migrated
@@ -69,6 +69,35 @@ def display_faq_list() -> None:
             st.write(question["answer"])
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_stored_news_image(image_ref: object) -> bytes:
+    """
+    Function that loads image stored in GridFS. Images are cached by their reference,
+    so GridFS is not queried again on every rerun.
+
+    Args:
+        image_ref (ObjectId): ID of the image in GridFS
+    Returns:
+        bytes: Raw bytes of the image
+    """
+    return mongo_db.get_file(image_ref)
+
+
+def load_news_image(record: dict) -> bytes:
+    """
+    Function that returns image of the news record. Images are stored in GridFS
+    and referenced by 'image_ref', older records may still contain inline 'image'.
+
+    Args:
+        record (dict): News record from MongoDB
+    Returns:
+        bytes: Raw bytes of the image
+    """
+    if record.get("image_ref"):
+        return load_stored_news_image(record["image_ref"])
+    return record["image"]
+
+
 def display_news_tiles(number: int) -> None:
     """
     Function that retrieves and displays news tiles in Streamlit application.
@@ -86,7 +115,7 @@ def display_news_tiles(number: int) -> None:
     except Exception as e:
         st_logger.error("Error during loading of news list: " + str(e))
     try:
-        image_bytes = record["image"]
+        image_bytes = load_news_image(record)
         image = Image.open(BytesIO(image_bytes))
         st.image(image)
     except Exception as e:
@@ -120,7 +149,7 @@ def display_news_list() -> None:
             with st.expander(record["title"], expanded=False):
                 st.write(record["content"])
                 try:
-                    image_bytes = record["image"]
+                    image_bytes = load_news_image(record)
                     image = Image.open(BytesIO(image_bytes))
                     st.image(image, use_container_width=True)
                 except Exception as e: